@@ -0,0 +1,258 @@
+"""
+Vectorized joint-angle engine.
+
+compute_angles() takes keypoints shaped (N, 17, 3) and returns every angle
+and distance that PoseCalibrator.get_all_joint_angles() reports, as (N,)
+arrays. All vertex angles, torso midpoints and left/right side selections
+are done for all frames at once instead of one small numpy call per value.
+
+Values are unrounded, in the dtype of the keypoints, and NaN where the
+joints involved are not confident enough (or a vector has zero length).
+"""
+from functools import lru_cache
+
+import numpy as np
+
+
+MIN_CONFIDENCE = 0.5
+
+# (point, vertex, point) for the eight joints drawn on the frame
+JOINT_ANGLES = {
+    'left_elbow': (5, 7, 9),
+    'right_elbow': (6, 8, 10),
+    'left_shoulder': (7, 5, 11),
+    'right_shoulder': (8, 6, 12),
+    'left_hip': (5, 11, 13),
+    'right_hip': (6, 12, 14),
+    'left_knee': (11, 13, 15),
+    'right_knee': (12, 14, 16),
+}
+
+# Angles measured on the more confident body side: (left triple, right triple)
+SIDE_ANGLES = {
+    'hip': ((5, 11, 13), (6, 12, 14)),          # shoulder-hip-knee
+    'knee': ((11, 13, 15), (12, 14, 16)),       # hip-knee-ankle
+    'shoulder': ((11, 5, 9), (12, 6, 10)),      # hip-shoulder-wrist
+    'elbow': ((5, 7, 9), (6, 8, 10)),           # shoulder-elbow-wrist
+}
+
+# Exercise-specific angle -> the side angle it is measured with
+SIDE_ANGLE_FEATURES = {
+    'hip_flexion_angle': 'hip',
+    'sitnreach_hip_angle': 'hip',
+    'sitnreach_back_angle': 'hip',
+    'sitnreach_knee_angle': 'knee',
+    'skip_back_angle': 'hip',
+    'skip_knee_angle': 'knee',
+    'jj_arm_angle': 'shoulder',
+    'jj_back_angle': 'hip',
+    'vjump_countermovement_angle': 'knee',
+    'vjump_arm_swing_angle': 'elbow',
+    'vjump_landing_knee_angle': 'knee',
+    'bjump_countermovement_angle': 'knee',
+    'bjump_arm_swing_angle': 'elbow',
+}
+
+# Pixel distances; everything else is an angle in degrees
+DISTANCE_FEATURES = ('reach_distance', 'arm_length', 'reach_symmetry')
+
+# Output order (same as get_all_joint_angles)
+FEATURES = list(JOINT_ANGLES) + [
+    'torso_angle', 'shin_angle_left', 'shin_angle_right',
+    'torso_inclination_horizontal', 'hip_flexion_angle',
+    'reach_distance', 'arm_length', 'sitnreach_hip_angle', 'sitnreach_back_angle',
+    'sitnreach_knee_angle', 'reach_symmetry',
+    'skip_back_angle', 'skip_knee_angle',
+    'jj_arm_angle', 'jj_back_angle',
+    'vjump_countermovement_angle', 'vjump_arm_swing_angle', 'vjump_landing_knee_angle',
+    'bjump_countermovement_angle', 'bjump_arm_swing_angle',
+]
+
+# Features measured from the torso line (hip mid -> shoulder mid)
+TORSO_FEATURES = ('torso_angle', 'torso_inclination_horizontal')
+
+# Shin features: (knee, ankle)
+SHIN_FEATURES = {'shin_angle_left': (13, 15), 'shin_angle_right': (14, 16)}
+
+
+def _dot(a, b):
+    """Row-wise dot product of (..., 2) arrays (batched matmul, same rounding as np.dot)"""
+    return (a[..., None, :] @ b[..., :, None])[..., 0, 0]
+
+
+def _norm(a):
+    """Row-wise length of (..., 2) arrays"""
+    return np.sqrt(_dot(a, a))
+
+
+def _vertex_angles(points, triples):
+    """
+    Angle at the middle point of each triple for every frame.
+    Returns (angles, degenerate), both (N, len(triples)); degenerate marks a
+    zero-length vector, where the angle is NaN.
+    """
+    vertex = points[:, triples[:, 1]]
+    v1 = points[:, triples[:, 0]] - vertex
+    v2 = points[:, triples[:, 2]] - vertex
+
+    v1_norm = _norm(v1)
+    v2_norm = _norm(v2)
+    degenerate = (v1_norm == 0) | (v2_norm == 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_angle = _dot(v1, v2) / (v1_norm * v2_norm)
+    angles = np.degrees(np.arccos(np.clip(cos_angle, -1.0, 1.0)))
+
+    return np.where(degenerate, np.nan, angles), degenerate
+
+
+def _vertical_angle(vectors):
+    """Angle of (..., 2) vectors against image-up; NaN for zero-length vectors"""
+    norm = _norm(vectors)
+    # The dot product with the integer up-vector is done in float64
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_angle = -vectors[..., 1].astype(np.float64) / norm.astype(np.float64)
+    angles = np.degrees(np.arccos(np.clip(cos_angle, -1.0, 1.0)))
+    return np.where(norm == 0, np.nan, angles)
+
+
+def _by_side(left_conf, right_conf, left, right):
+    """
+    Value from the more confident side (min joint confidence): left if it
+    beats right and MIN_CONFIDENCE, else right if it beats MIN_CONFIDENCE,
+    else NaN.
+    """
+    use_left = (left_conf > right_conf) & (left_conf > MIN_CONFIDENCE)
+    use_right = right_conf > MIN_CONFIDENCE
+    return np.where(use_left, left, np.where(use_right, right, np.nan))
+
+
+def reads_features(*features):
+    """
+    Decorator for exercise handlers: declares the features the handler (and
+    the metrics it feeds) reads from the angles dict. Read back through the
+    handler's .features attribute.
+    """
+    unknown = [name for name in features if name not in FEATURES]
+    if unknown:
+        raise ValueError(f"Unknown angle features: {', '.join(unknown)}")
+    
+    def decorate(handler):
+        handler.features = tuple(features)
+        return handler
+    return decorate
+
+
+class _Plan:
+    """What compute_angles has to evaluate for one set of requested features"""
+
+    def __init__(self, features):
+        if features is None:
+            features = FEATURES
+        unknown = set(features) - set(FEATURES)
+        if unknown:
+            raise ValueError(f"Unknown angle features: {', '.join(sorted(unknown))}")
+        self.features = [name for name in FEATURES if name in set(features)]
+
+        self.joints = [name for name in JOINT_ANGLES if name in self.features]
+        self.sides = list(dict.fromkeys(SIDE_ANGLE_FEATURES[name] for name in self.features
+                                        if name in SIDE_ANGLE_FEATURES))
+        self.torso = any(name in self.features for name in TORSO_FEATURES)
+        self.shins = [name for name in SHIN_FEATURES if name in self.features]
+
+        # Dependencies: only the (point, vertex, point) triples these need
+        triples = [JOINT_ANGLES[name] for name in self.joints]
+        for side_name in self.sides:
+            triples.extend(SIDE_ANGLES[side_name])
+        triples = list(dict.fromkeys(triples))
+        index = {triple: i for i, triple in enumerate(triples)}
+
+        self.triples = np.asarray(triples, dtype=int).reshape(-1, 3)
+        self.joint_columns = [index[JOINT_ANGLES[name]] for name in self.joints]
+        self.left_columns = [index[SIDE_ANGLES[side_name][0]] for side_name in self.sides]
+        self.right_columns = [index[SIDE_ANGLES[side_name][1]] for side_name in self.sides]
+
+
+@lru_cache(maxsize=64)
+def _plan(features):
+    return _Plan(features)
+
+
+def compute_angles(keypoints, features=None):
+    """
+    Compute angles / distances for a stack of frames.
+
+    keypoints: (N, 17, 3) array of x, y, confidence.
+    features: names to compute (default: all FEATURES); only the joints,
+    side selections and midpoints they depend on are evaluated.
+    Returns {feature: (N,) array} in FEATURES order.
+    """
+    plan = _plan(None if features is None else tuple(features))
+    keypoints = np.asarray(keypoints)
+    points = keypoints[..., :2]
+    conf = keypoints[..., 2]
+    values = {}
+
+    if len(plan.triples):
+        # Every needed vertex angle (joints and both body sides) in one pass
+        triple_angles, degenerate = _vertex_angles(points, plan.triples)
+        triple_conf = np.min(conf[:, plan.triples], axis=-1)
+
+    if plan.joints:
+        # Joint angles report 0 (not None) for a zero-length vector
+        columns = plan.joint_columns
+        joints = np.where(degenerate[:, columns], 0, triple_angles[:, columns])
+        joints = np.where(triple_conf[:, columns] > MIN_CONFIDENCE, joints, np.nan)
+        values.update(zip(plan.joints, joints.T))
+
+    if plan.sides:
+        left, right = plan.left_columns, plan.right_columns
+        sides = _by_side(triple_conf[:, left], triple_conf[:, right],
+                         triple_angles[:, left], triple_angles[:, right])
+        side_values = dict(zip(plan.sides, sides.T))
+        for name in plan.features:
+            if name in SIDE_ANGLE_FEATURES:
+                values[name] = side_values[SIDE_ANGLE_FEATURES[name]]
+
+    if plan.torso:
+        torso = (points[:, 5] + points[:, 6]) / 2 - (points[:, 11] + points[:, 12]) / 2
+        torso_ok = np.all(conf[:, [5, 6, 11, 12]] > MIN_CONFIDENCE, axis=1)
+
+        values['torso_angle'] = np.where(torso_ok, _vertical_angle(torso), np.nan)
+
+        inclination = np.abs(np.degrees(np.arctan2(-torso[:, 1], torso[:, 0])))
+        values['torso_inclination_horizontal'] = np.where(torso_ok, inclination, np.nan)
+
+    if plan.shins:
+        # Both shins (ankle -> knee) against vertical together
+        joints = np.asarray([SHIN_FEATURES[name] for name in plan.shins])
+        shins = _vertical_angle(points[:, joints[:, 0]] - points[:, joints[:, 1]])
+        shin_ok = np.all(conf[:, joints] > MIN_CONFIDENCE, axis=-1)
+        values.update(zip(plan.shins, np.where(shin_ok, shins, np.nan).T))
+
+    # Sit-and-reach distances (pixels)
+    if 'reach_distance' in plan.features:
+        reach_ok = ((np.maximum(conf[:, 9], conf[:, 10]) > MIN_CONFIDENCE) &
+                    (np.maximum(conf[:, 15], conf[:, 16]) > MIN_CONFIDENCE))
+        reach = (points[:, 9, 0] + points[:, 10, 0]) / 2 - (points[:, 15, 0] + points[:, 16, 0]) / 2
+        values['reach_distance'] = np.where(reach_ok, reach, np.nan)
+
+    if 'arm_length' in plan.features:
+        arm_lengths = _norm(points[:, [9, 10]] - points[:, [5, 6]])
+        arm_conf = np.minimum(conf[:, [5, 6]], conf[:, [9, 10]])
+        values['arm_length'] = _by_side(arm_conf[:, 0], arm_conf[:, 1], arm_lengths[:, 0], arm_lengths[:, 1])
+
+    if 'reach_symmetry' in plan.features:
+        symmetry_ok = (conf[:, 9] > MIN_CONFIDENCE) & (conf[:, 10] > MIN_CONFIDENCE)
+        values['reach_symmetry'] = np.where(symmetry_ok, np.abs(points[:, 9, 0] - points[:, 10, 0]), np.nan)
+
+    return {name: values[name] for name in plan.features}
+
+
+def frame_value(name, value):
+    """One frame's value as get_all_joint_angles reports it: None, int degrees or a distance"""
+    if np.isnan(value):
+        return None
+    if name in DISTANCE_FEATURES:
+        return value
+    return int(round(value))
@@ -1,6 +1,7 @@
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
-from fastapi.responses import StreamingResponse, JSONResponse, FileResponse
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse, FileResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from contextlib import asynccontextmanager
 import cv2
 import numpy as np
@@ -8,26 +9,74 @@ import tempfile
 import os
 import shutil
 from pathlib import Path
+from collections import deque
+from typing import Optional
 import json
 import asyncio
-from io import StringIO
+from io import BytesIO, StringIO
 import sys
 
 from utils import PoseCalibrator
-from metrics import PerformanceMetrics
+from angles import reads_features
+from metrics import create_metrics
+from pipeline import FramePipeline
+from backends import create_backend_pool
+from jobs import JobQueue
+from keypoint_cache import KeypointCache
+from renderer import DeferredRenderer, HighlightRenderer
 
-# Global instance
-evaluator = None
+# Pose models shared by all sessions, and the options each session gets
+model_pool = None
+session_options = {}
+
+# Background analysis jobs started by /analyze
+job_queue = None
+
+EXERCISES = ['pushup', 'squat', 'situp', 'sitnreach', 'skipping', 'jumpingjacks', 'vjump', 'bjump']
+
+# save_output videos: every frame annotated, or a reel of the reps / jumps only
+OUTPUT_MODES = ['full', 'highlights']
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    global evaluator
-    evaluator = ExerciseEvaluator()
+    global model_pool, session_options, job_queue
+    backend = os.environ.get('POSE_BACKEND', 'torch')
+    imgsz = int(os.environ['POSE_IMGSZ']) if os.environ.get('POSE_IMGSZ') else None
+    pool_size = int(os.environ.get('POSE_POOL_SIZE', '2'))
+    backend_options = {'imgsz': imgsz} if imgsz else {}
+    calibration_videos = os.environ.get('POSE_CALIBRATION_VIDEOS')
+    if backend == 'onnx-int8' and calibration_videos:
+        # Static INT8: calibrate activation ranges on our own exercise videos
+        backend_options['calibration_videos'] = calibration_videos.split(os.pathsep)
+    model_pool = create_backend_pool(backend, model_path='yolov8n-pose.pt', size=pool_size,
+                                     **backend_options)
+    session_options = {
+        'tracking': os.environ.get('POSE_TRACKING', '0') == '1',
+        'motion_gate': os.environ.get('POSE_MOTION_GATE', '0') == '1',
+    }
+    # Output video encoding: H.264 MP4 through ffmpeg (MJPG AVI without it)
+    output_height = os.environ.get('POSE_OUTPUT_HEIGHT')
+    session_options['output_options'] = {
+        'codec': os.environ.get('POSE_OUTPUT_CODEC', 'h264'),
+        'crf': int(os.environ.get('POSE_OUTPUT_CRF', '23')),
+        'preset': os.environ.get('POSE_OUTPUT_PRESET', 'veryfast'),
+        'height': int(output_height) if output_height else None,
+        'ffmpeg': os.environ.get('POSE_FFMPEG', 'ffmpeg'),
+    }
+    cache_mb = float(os.environ.get('POSE_KEYPOINT_CACHE_MB', '512'))
+    if cache_mb > 0:
+        # Keypoints of analysed videos, replayed when the same file comes again
+        session_options['keypoint_cache'] = KeypointCache(os.environ.get('POSE_KEYPOINT_CACHE_DIR'),
+                                                          max_bytes=int(cache_mb * 1024 * 1024))
+    job_queue = JobQueue(workers=int(os.environ.get('POSE_JOB_WORKERS', pool_size)),
+                         retention=float(os.environ.get('POSE_JOB_RETENTION', '3600')),
+                         on_expire=remove_job_files)
     print("✓ AI Exercise Trainer API Started")
-    print("✓ Model loaded: yolov8n-pose.pt")
+    print(f"✓ Model loaded: yolov8n-pose.pt ({model_pool.name} backend, pool of {len(model_pool)})")
     yield
     # Shutdown
+    job_queue.shutdown(wait=False)
     print("✓ API Shutting down")
 
 app = FastAPI(title="AI Exercise Trainer API", version="1.0.0", lifespan=lifespan)
@@ -42,9 +91,33 @@ app.add_middleware(
 )
 
 class ExerciseEvaluator:
-    def __init__(self):
-        self.calibrator = PoseCalibrator(model_path='yolov8n-pose.pt')
-        self.metrics = PerformanceMetrics()
+    def __init__(self, batch_size=8, backend='torch', imgsz=None, tracking=False, motion_gate=False,
+                 keypoint_cache=None, output_options=None):
+        self.calibrator = PoseCalibrator(model_path='yolov8n-pose.pt', backend=backend, imgsz=imgsz,
+                                         tracking=tracking, motion_gate=motion_gate)
+        # Built for the exercise by start_session
+        self.metrics = None
+        
+        # Optional KeypointCache: process_video replays keypoints of videos seen before
+        self.keypoint_cache = keypoint_cache
+        # DeferredRenderer drawing the last process_video's output video, and
+        # its encoder settings (open_video_writer: codec, crf, preset, height)
+        self.renderer = None
+        self.output_options = output_options or {}
+        # Highlight reel window around each rep / jump (seconds before, after)
+        self.highlight_window = (2.0, 1.0)
+        
+        # Frames decoded per model call in process_video
+        self.batch_size = batch_size
+        
+        # Largest inference stride per exercise; short airborne phases need
+        # (nearly) every frame, so jumps opt out of or limit frame skipping
+        self.max_stride = {'skipping': 1, 'vjump': 2, 'bjump': 2}
+        
+        # Where each exercise keeps its rep count when it is not self.counter
+        # (sitnreach has no reps: its counter is the reach)
+        self.rep_counters = {'skipping': 'jump_count', 'jumpingjacks': 'jj_rep_count',
+                             'vjump': 'vjump_jump_count', 'bjump': 'bjump_jump_count'}
         
         # Exercise State Variables
         self.current_exercise = None
@@ -73,122 +146,149 @@ class ExerciseEvaluator:
         self.logs.append(message)
         print(message)  # Also print to console
 
-    def _draw_dashboard(self, frame, exercise_name):
-        """Draws the exercise statistics overlay."""
+    def dashboard_state(self, exercise_name):
+        """
+        Snapshot of what the dashboard shows for the current frame, so the
+        frame can be drawn later (see DeferredRenderer).
+        """
+        metrics = self.session_metrics(exercise_name)
+        state = {'counter': self.counter, 'stage': self.stage, 'feedback': self.feedback}
+        
+        if exercise_name == 'sitnreach':
+            state['max_reach'] = int(metrics.max_reach_distance) if metrics.max_reach_distance > 0 else 0
+            state['current_reach'] = int(metrics.reach_distances[-1]) if metrics.reach_distances else 0
+        elif exercise_name == 'skipping':
+            state['jumps'] = metrics.jump_count
+            state['frequency'] = metrics._get_skipping_frequency() if hasattr(metrics, '_get_skipping_frequency') else 0
+        elif exercise_name == 'jumpingjacks':
+            state['reps'] = metrics.jj_rep_count
+            state['jj_state'] = metrics.jj_state
+        elif exercise_name == 'vjump':
+            state['jumps'] = metrics.vjump_jump_count
+            state['max_height'] = int(max(metrics.vjump_jump_heights)) if metrics.vjump_jump_heights else 0
+            state['jump_state'] = metrics.vjump_state
+        elif exercise_name == 'bjump':
+            state['jumps'] = metrics.bjump_jump_count
+            state['max_distance'] = int(metrics.bjump_max_distance)
+            state['jump_state'] = metrics.bjump_state
+        
+        return state
+
+    def _draw_dashboard(self, frame, exercise_name, state=None):
+        """Draws the exercise statistics overlay (from a dashboard_state snapshot, default: now)."""
+        if state is None:
+            state = self.dashboard_state(exercise_name)
+        
         if exercise_name == 'sitnreach':
             cv2.rectangle(frame, (0, 0), (240, 90), (16, 117, 245), -1)
             cv2.putText(frame, 'MAX REACH (px)', (10, 25), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1, cv2.LINE_AA)
-            max_distance = int(self.metrics.max_reach_distance) if self.metrics.max_reach_distance > 0 else 0
-            cv2.putText(frame, str(max_distance), (20, 75), 
+            cv2.putText(frame, str(state['max_reach']), (20, 75), 
                         cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3, cv2.LINE_AA)
             
             cv2.rectangle(frame, (250, 0), (490, 90), (245, 117, 16), -1)
             cv2.putText(frame, 'CURRENT (px)', (260, 25), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1, cv2.LINE_AA)
-            current_distance = int(self.metrics.reach_distances[-1]) if self.metrics.reach_distances else 0
-            cv2.putText(frame, str(current_distance), (270, 75), 
+            cv2.putText(frame, str(state['current_reach']), (270, 75), 
                         cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3, cv2.LINE_AA)
             
-            color = (0, 255, 0) if self.stage == "VALID" else (0, 165, 255)
+            color = (0, 255, 0) if state['stage'] == "VALID" else (0, 165, 255)
             cv2.rectangle(frame, (0, 95), (490, 130), (255, 255, 255), -1)
-            cv2.putText(frame, self.feedback, (10, 120), 
+            cv2.putText(frame, state['feedback'], (10, 120), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.55, color, 1, cv2.LINE_AA)
         elif exercise_name == 'skipping':
             cv2.rectangle(frame, (0, 0), (180, 90), (117, 245, 16), -1)
             cv2.putText(frame, 'JUMPS', (15, 25), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1, cv2.LINE_AA)
-            cv2.putText(frame, str(self.metrics.jump_count), (20, 75), 
+            cv2.putText(frame, str(state['jumps']), (20, 75), 
                         cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3, cv2.LINE_AA)
             
             cv2.rectangle(frame, (190, 0), (380, 90), (245, 200, 16), -1)
             cv2.putText(frame, 'SKIPS/SEC', (200, 25), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 1, cv2.LINE_AA)
-            frequency = self.metrics._get_skipping_frequency() if hasattr(self.metrics, '_get_skipping_frequency') else 0
-            cv2.putText(frame, f"{frequency:.1f}", (210, 75), 
+            cv2.putText(frame, f"{state['frequency']:.1f}", (210, 75), 
                         cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3, cv2.LINE_AA)
             
-            color = (0, 255, 0) if self.stage == "AIR" else (200, 200, 200)
+            color = (0, 255, 0) if state['stage'] == "AIR" else (200, 200, 200)
             cv2.rectangle(frame, (0, 95), (380, 130), (255, 255, 255), -1)
-            cv2.putText(frame, self.feedback, (10, 120), 
+            cv2.putText(frame, state['feedback'], (10, 120), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.55, color, 1, cv2.LINE_AA)
         elif exercise_name == 'jumpingjacks':
             cv2.rectangle(frame, (0, 0), (180, 90), (200, 117, 245), -1)
             cv2.putText(frame, 'REPS', (15, 25), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1, cv2.LINE_AA)
-            cv2.putText(frame, str(self.metrics.jj_rep_count), (20, 75), 
+            cv2.putText(frame, str(state['reps']), (20, 75), 
                         cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3, cv2.LINE_AA)
             
             cv2.rectangle(frame, (190, 0), (380, 90), (117, 200, 245), -1)
             cv2.putText(frame, 'STATE', (200, 25), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 1, cv2.LINE_AA)
-            state_text = self.metrics.jj_state.upper()
+            state_text = state['jj_state'].upper()
             cv2.putText(frame, state_text, (200, 70), 
                         cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2, cv2.LINE_AA)
             
-            color = (0, 255, 0) if self.metrics.jj_state == 'open' else (200, 200, 200)
+            color = (0, 255, 0) if state['jj_state'] == 'open' else (200, 200, 200)
             cv2.rectangle(frame, (0, 95), (380, 130), (255, 255, 255), -1)
-            cv2.putText(frame, self.feedback, (10, 120), 
+            cv2.putText(frame, state['feedback'], (10, 120), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.55, color, 1, cv2.LINE_AA)
         elif exercise_name == 'vjump':
             cv2.rectangle(frame, (0, 0), (180, 90), (16, 245, 117), -1)
             cv2.putText(frame, 'JUMPS', (15, 25), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1, cv2.LINE_AA)
-            cv2.putText(frame, str(self.metrics.vjump_jump_count), (20, 75), 
+            cv2.putText(frame, str(state['jumps']), (20, 75), 
                         cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3, cv2.LINE_AA)
             
             cv2.rectangle(frame, (190, 0), (400, 90), (245, 117, 245), -1)
             cv2.putText(frame, 'MAX (px)', (200, 25), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 1, cv2.LINE_AA)
-            max_height = int(max(self.metrics.vjump_jump_heights)) if self.metrics.vjump_jump_heights else 0
-            cv2.putText(frame, str(max_height), (210, 75), 
+            cv2.putText(frame, str(state['max_height']), (210, 75), 
                         cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3, cv2.LINE_AA)
             
             state_colors = {'standing': (200, 200, 200), 'airborne': (0, 255, 0), 'landing': (255, 165, 0)}
-            color = state_colors.get(self.metrics.vjump_state, (200, 200, 200))
+            color = state_colors.get(state['jump_state'], (200, 200, 200))
             cv2.rectangle(frame, (0, 95), (400, 130), (255, 255, 255), -1)
-            cv2.putText(frame, self.feedback, (10, 120), 
+            cv2.putText(frame, state['feedback'], (10, 120), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.55, color, 1, cv2.LINE_AA)
         elif exercise_name == 'bjump':
             cv2.rectangle(frame, (0, 0), (180, 90), (245, 117, 16), -1)
             cv2.putText(frame, 'JUMPS', (15, 25), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1, cv2.LINE_AA)
-            cv2.putText(frame, str(self.metrics.bjump_jump_count), (20, 75), 
+            cv2.putText(frame, str(state['jumps']), (20, 75), 
                         cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3, cv2.LINE_AA)
             
             cv2.rectangle(frame, (190, 0), (400, 90), (16, 200, 245), -1)
             cv2.putText(frame, 'MAX DIST (px)', (200, 25), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 1, cv2.LINE_AA)
-            max_dist = int(self.metrics.bjump_max_distance)
-            cv2.putText(frame, str(max_dist), (210, 75), 
+            cv2.putText(frame, str(state['max_distance']), (210, 75), 
                         cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3, cv2.LINE_AA)
             
             state_colors_bjump = {'standing': (200, 200, 200), 'airborne': (0, 255, 0), 'landing': (255, 165, 0)}
-            color = state_colors_bjump.get(self.metrics.bjump_state, (200, 200, 200))
+            color = state_colors_bjump.get(state['jump_state'], (200, 200, 200))
             cv2.rectangle(frame, (0, 95), (400, 130), (255, 255, 255), -1)
-            cv2.putText(frame, self.feedback, (10, 120), 
+            cv2.putText(frame, state['feedback'], (10, 120), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.55, color, 1, cv2.LINE_AA)
         else:
             cv2.rectangle(frame, (0, 0), (225, 73), (245, 117, 16), -1)
             
             cv2.putText(frame, 'REPS', (15, 12), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 1, cv2.LINE_AA)
-            cv2.putText(frame, str(self.counter), (10, 60), 
+            cv2.putText(frame, str(state['counter']), (10, 60), 
                         cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 2, cv2.LINE_AA)
             
             cv2.putText(frame, 'STAGE', (65, 12), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 1, cv2.LINE_AA)
-            cv2.putText(frame, str(self.stage if self.stage else '-'), (60, 60), 
+            cv2.putText(frame, str(state['stage'] if state['stage'] else '-'), (60, 60), 
                         cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 2, cv2.LINE_AA)
 
-            color = (0, 255, 0) if self.feedback == "Good Form" else (0, 0, 255)
+            color = (0, 255, 0) if state['feedback'] == "Good Form" else (0, 0, 255)
             cv2.rectangle(frame, (0, 73), (225, 103), (255, 255, 255), -1)
-            cv2.putText(frame, self.feedback, (15, 95), 
+            cv2.putText(frame, state['feedback'], (15, 95), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 1, cv2.LINE_AA)
         
         return frame
 
-    def process_pushup(self, angles, keypoints):
+    @reads_features('left_elbow', 'right_elbow', 'left_hip', 'right_hip')
+    def process_pushup(self, angles, keypoints, current_time=None):
         """Logic for Pushups"""
         if keypoints is None or len(keypoints) < 17:
             self.feedback = "Body not detected"
@@ -237,7 +337,8 @@ class ExerciseEvaluator:
             
             self.log(f"Pushup Count: {self.counter}")
 
-    def process_squat(self, angles, keypoints):
+    @reads_features('left_knee', 'right_knee', 'torso_angle', 'shin_angle_left', 'shin_angle_right')
+    def process_squat(self, angles, keypoints, current_time=None):
         """Logic for Squats"""
         if keypoints is None or len(keypoints) < 17:
             self.feedback = "Body not detected"
@@ -256,7 +357,8 @@ class ExerciseEvaluator:
             self.feedback = "Legs not visible"
             return
         
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         torso_angle = angles.get('torso_angle')
         shin_angle_left = angles.get('shin_angle_left')
         shin_angle_right = angles.get('shin_angle_right')
@@ -336,14 +438,16 @@ class ExerciseEvaluator:
             if self.stage != "DOWN":
                 self.feedback = "Squat"
 
-    def process_situp(self, angles, keypoints):
+    @reads_features('torso_inclination_horizontal', 'hip_flexion_angle')
+    def process_situp(self, angles, keypoints, current_time=None):
         """Logic for Sit-ups"""
         if keypoints is None or len(keypoints) < 17:
             self.feedback = "Body not detected"
             return
         
         import time
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         
         torso_inclination = angles.get('torso_inclination_horizontal')
         hip_flexion = angles.get('hip_flexion_angle')
@@ -437,14 +541,17 @@ class ExerciseEvaluator:
                 self.metrics.situp_state = 'descending'
                 self.feedback = "Controlled Down"
 
-    def process_sitnreach(self, angles, keypoints):
+    @reads_features('reach_distance', 'arm_length', 'sitnreach_hip_angle',
+                    'sitnreach_back_angle', 'sitnreach_knee_angle', 'reach_symmetry')
+    def process_sitnreach(self, angles, keypoints, current_time=None):
         """Logic for Sit-and-Reach"""
         if keypoints is None or len(keypoints) < 17:
             self.feedback = "Body not detected"
             return
         
         import time
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         
         if self.metrics.sitnreach_start_time is None:
             self.metrics.sitnreach_start_time = current_time
@@ -479,7 +586,7 @@ class ExerciseEvaluator:
         if knee_angle and knee_angle < self.thresholds['sitnreach']['knee_valid']:
             feedback_parts.append("Straighten Legs!")
         
-        if symmetry_error and symmetry_error > 50:
+        if symmetry_error and symmetry_error > self.metrics._px('sitnreach_max_symmetry_error'):
             feedback_parts.append("Balance Both Sides")
         
         if hip_angle:
@@ -501,14 +608,16 @@ class ExerciseEvaluator:
         else:
             self.stage = "INVALID"
 
-    def process_skipping(self, angles, keypoints):
+    @reads_features('skip_back_angle', 'skip_knee_angle')
+    def process_skipping(self, angles, keypoints, current_time=None):
         """Logic for Skipping"""
         if keypoints is None or len(keypoints) < 17:
             self.feedback = "Body not detected"
             return
         
         import time
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         
         if self.metrics.skip_start_time is None:
             self.metrics.skip_start_time = current_time
@@ -541,14 +650,16 @@ class ExerciseEvaluator:
         
         self.feedback = " | ".join(feedback_parts)
 
-    def process_jumpingjacks(self, angles, keypoints):
+    @reads_features('jj_arm_angle', 'jj_back_angle')
+    def process_jumpingjacks(self, angles, keypoints, current_time=None):
         """Logic for Jumping Jacks"""
         if keypoints is None or len(keypoints) < 17:
             self.feedback = "Body not detected"
             return
         
         import time
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         
         if self.metrics.jj_start_time is None:
             self.metrics.jj_start_time = current_time
@@ -565,8 +676,12 @@ class ExerciseEvaluator:
         feedback_parts.append(state_text)
         
         arm_status = "✓" if arm_angle >= 135 else ("✗" if arm_angle <= 45 else "~")
-        leg_status = "✓" if leg_spread >= 120 else ("✗" if leg_spread <= 100 else "~")
-        spread_status = "✓" if arm_spread >= 180 else ("✗" if arm_spread <= 120 else "~")
+        leg_open = self.metrics._px('jj_leg_open_threshold')
+        leg_closed = self.metrics._px('jj_leg_close_threshold')
+        arm_open = self.metrics._px('jj_arm_open_threshold')
+        arm_closed = self.metrics._px('jj_arm_close_threshold')
+        leg_status = "✓" if leg_spread >= leg_open else ("✗" if leg_spread <= leg_closed else "~")
+        spread_status = "✓" if arm_spread >= arm_open else ("✗" if arm_spread <= arm_closed else "~")
         
         feedback_parts.append(f"Angle:{int(arm_angle)}°{arm_status}")
         feedback_parts.append(f"ArmSpread:{int(arm_spread)}px{spread_status}")
@@ -578,19 +693,22 @@ class ExerciseEvaluator:
         else:
             if arm_angle > 60:
                 feedback_parts.append("↓ LOWER ARMS!")
-            if leg_spread > 120:
+            if leg_spread > leg_open:
                 feedback_parts.append("→← FEET TOGETHER!")
         
         self.feedback = " | ".join(feedback_parts)
 
-    def process_vjump(self, angles, keypoints):
+    @reads_features('vjump_countermovement_angle', 'vjump_arm_swing_angle',
+                    'vjump_landing_knee_angle')
+    def process_vjump(self, angles, keypoints, current_time=None):
         """Logic for Vertical Jump"""
         if keypoints is None or len(keypoints) < 17:
             self.feedback = "Body not detected"
             return
         
         import time
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         
         if self.metrics.vjump_start_time is None:
             self.metrics.vjump_start_time = current_time
@@ -633,14 +751,16 @@ class ExerciseEvaluator:
         
         self.feedback = " | ".join(feedback_parts)
 
-    def process_bjump(self, angles, keypoints):
+    @reads_features('bjump_countermovement_angle', 'bjump_arm_swing_angle')
+    def process_bjump(self, angles, keypoints, current_time=None):
         """Logic for Broad Jump"""
         if keypoints is None or len(keypoints) < 17:
             self.feedback = "Body not detected"
             return
         
         import time
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         
         if self.metrics.bjump_start_time is None:
             self.metrics.bjump_start_time = current_time
@@ -668,15 +788,255 @@ class ExerciseEvaluator:
         
         self.feedback = " | ".join(feedback_parts)
 
-    def process_video(self, video_path, exercise_type, save_output=False):
-        """Process video file and return results"""
+    def exercise_features(self, exercise_type):
+        """Angle features the exercise's handler declares with @reads_features (None = all)"""
+        handler = getattr(self, f'process_{exercise_type}', None)
+        return getattr(handler, 'features', None)
+
+    def _process_exercise(self, exercise_type, angles, keypoints, current_time=None):
+        """
+        Dispatch one frame's angles to the handler of the current exercise.
+        current_time is the frame's timestamp (seconds, video clock); None
+        means now (wall clock, for live frames without timestamps).
+        """
+        if self.metrics is None:
+            self.start_session(exercise_type)
+        
+        # Pixel thresholds scale with the athlete's measured torso length
+        self.metrics.body_scale = self.calibrator.body_scale
+        # Durations and rates in the reports are measured on the same clock
+        self.metrics.current_time = current_time
+        
+        if exercise_type == 'pushup':
+            self.process_pushup(angles, keypoints, current_time)
+        elif exercise_type == 'squat':
+            self.process_squat(angles, keypoints, current_time)
+        elif exercise_type == 'situp':
+            self.process_situp(angles, keypoints, current_time)
+        elif exercise_type == 'sitnreach':
+            self.process_sitnreach(angles, keypoints, current_time)
+        elif exercise_type == 'skipping':
+            self.process_skipping(angles, keypoints, current_time)
+        elif exercise_type == 'jumpingjacks':
+            self.process_jumpingjacks(angles, keypoints, current_time)
+        elif exercise_type == 'vjump':
+            self.process_vjump(angles, keypoints, current_time)
+        elif exercise_type == 'bjump':
+            self.process_bjump(angles, keypoints, current_time)
+
+    def session_metrics(self, exercise_type):
+        """This session's metrics; empty ones for exercise_type before start_session"""
+        if self.metrics is None:
+            return create_metrics(exercise_type)
+        return self.metrics
+
+    def rep_count(self, exercise_type):
+        """Reps (jumps for the jump exercises) counted so far; None for sitnreach"""
+        if exercise_type == 'sitnreach':
+            return None
+        if exercise_type in self.rep_counters:
+            return getattr(self.session_metrics(exercise_type), self.rep_counters[exercise_type])
+        return self.counter
+
+    def start_session(self, exercise_type):
+        """Reset counters, metrics, logs and tracking for a new exercise session"""
         import time
-        from datetime import datetime
         
         self.logs = []
         self.current_exercise = exercise_type
-        self.metrics.exercise = exercise_type
+        # Fresh state for every session, holding only this exercise's metrics
+        self.metrics = create_metrics(exercise_type)
+        self.counter = 0
+        self.stage = None
+        self.feedback = "Setup"
         self.start_time = time.time()
+        self.calibrator.reset_tracking()
+        # Only the angles this exercise's handler reads
+        self.calibrator.set_features(self.exercise_features(exercise_type))
+
+    def score_frame(self, exercise_type, frame=None, keypoints=None, current_time=None):
+        """
+        Score one live frame without drawing: runs the model on frame, or
+        uses the given keypoints. Returns the session state after the frame,
+        with a rep event for every rep it completed.
+        """
+        if frame is not None:
+            keypoints = self.calibrator.detect_pose(frame)
+        
+        reps_before = self.rep_count(exercise_type)
+        angles = self.calibrator.analyze_keypoints(keypoints, current_time)
+        if keypoints is not None:
+            self._process_exercise(exercise_type, angles, keypoints, current_time)
+        reps = self.rep_count(exercise_type)
+        
+        events = []
+        if reps is not None:
+            events = [{'event': 'rep', 'count': int(count)} for count in range(reps_before + 1, reps + 1)]
+        
+        return {
+            'person_detected': keypoints is not None,
+            'counter': int(self.counter),
+            'stage': self.stage,
+            'feedback': self.feedback,
+            'reps': int(reps) if reps is not None else None,
+            'events': events,
+        }
+
+    def exercise_metrics(self, exercise_type):
+        """Final metrics report of the session (prints it like test.py)"""
+        metrics = self.session_metrics(exercise_type)
+        result = None
+        if exercise_type == 'pushup':
+            result = metrics.pushup_metrics()
+        elif exercise_type == 'squat':
+            result = metrics.squat_metrics()
+        elif exercise_type == 'situp':
+            result = metrics.situp_metrics()
+        elif exercise_type == 'sitnreach':
+            result = metrics.sitnreach_metrics()
+        elif exercise_type == 'skipping':
+            result = metrics.skipping_metrics()
+        elif exercise_type == 'jumpingjacks':
+            result = metrics.jumpingjacks_metrics()
+        elif exercise_type == 'vjump':
+            result = metrics.vjump_metrics()
+        elif exercise_type == 'bjump':
+            result = metrics.bjump_metrics()
+        return result
+
+    def process_keypoint_stream(self, keypoints, timestamps, exercise_type, progress=None, source=None,
+                                renderer=None):
+        """
+        Score keypoints detected elsewhere (e.g. on the athlete's device, or
+        cached from an earlier run): no video decoding and no model.
+        keypoints is (T, 17, 3) with x, y, confidence in pixels; frames where
+        no joint has confidence > 0 mean no person. timestamps is (T,)
+        seconds. Returns the metrics report.
+        renderer: a DeferredRenderer for the stream's source video, fed a
+        record per frame so the replay can still produce the annotated video.
+        """
+        from datetime import datetime
+        
+        self.start_session(exercise_type)
+        
+        self.log(f"\n{'='*50}")
+        self.log(f"Starting {exercise_type.upper()} analysis ({source or 'keypoints'}, {len(keypoints)} frames)...")
+        self.log(f"{'='*50}\n")
+        
+        # Angles for the whole stream in one vectorized pass
+        features = self.calibrator.overlay_features() if renderer else None
+        frame_angles = self.calibrator.get_joint_angles_batch(keypoints, features)
+        detected = np.max(keypoints[:, :, 2], axis=1) > 0
+        
+        for i, (frame_keypoints, angles, timestamp) in enumerate(zip(keypoints, frame_angles, timestamps)):
+            # Handlers get the frame's time since the start of the stream
+            current_time = float(timestamp - timestamps[0])
+            
+            if detected[i]:
+                self.calibrator.update_frame_state(frame_keypoints, current_time)
+                self._process_exercise(exercise_type, angles, frame_keypoints, current_time)
+            else:
+                self.calibrator.update_frame_state(None, current_time)
+            
+            if renderer:
+                if detected[i]:
+                    self._render_frame(renderer, i, frame_keypoints, angles, exercise_type)
+                else:
+                    self._render_frame(renderer, i, None, {}, exercise_type)
+            
+            if progress:
+                progress(i + 1, len(keypoints))
+        
+        self.log("\n" + "="*50)
+        self.log("Analysis Complete!")
+        self.log("="*50)
+        
+        result = self.exercise_metrics(exercise_type)
+        if result:
+            result['timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            result['logs'] = self.logs
+        
+        return result
+
+    def _inference_stride(self, exercise_type, fps, target_fps=None, stride=None):
+        """Frames per model call: explicit stride, else fps / target_fps, capped per exercise"""
+        if stride is None:
+            stride = round(fps / target_fps) if target_fps and fps > 0 else 1
+        stride = max(1, int(stride))
+        
+        return min(stride, self.max_stride.get(exercise_type, stride))
+
+    def _render_record(self, frame, record, exercise_type):
+        """Draw one scored frame for the DeferredRenderer (runs on its thread, reads only the record)"""
+        frame = self.calibrator.render(frame, record.keypoints, record.angles, record.calibration)
+        return self._draw_dashboard(frame, exercise_type, record.dashboard)
+
+    def _start_renderer(self, video_path, exercise_type, fps, output_mode='full'):
+        """
+        Start the renderer for process_video's output: every frame ('full'),
+        or only windows around reps and jumps ('highlights').
+        """
+        if output_mode not in OUTPUT_MODES:
+            raise ValueError(f"Unknown output mode: {output_mode}")
+        
+        def draw(frame, record):
+            return self._render_record(frame, record, exercise_type)
+        
+        # The extension follows the codec (.mp4 for H.264, .avi for MJPG)
+        base = os.path.splitext(video_path)[0]
+        if output_mode == 'highlights':
+            before, after = self.highlight_window
+            fps = fps if fps > 0 else 30.0
+            renderer = HighlightRenderer(video_path, base + '_highlights.mp4', draw,
+                                         before=round(before * fps), after=round(after * fps),
+                                         **self.output_options)
+        else:
+            renderer = DeferredRenderer(video_path, base + '_processed.mp4', draw, **self.output_options)
+        
+        # Rep count and sit-and-reach best already handed to the renderer
+        self._rendered_reps = self.rep_count(exercise_type)
+        self._rendered_reach = None
+        return renderer.start()
+
+    def _render_frame(self, renderer, index, keypoints, angles, exercise_type):
+        """Hand the frame just scored to the renderer, marking reps / jumps and a new best reach"""
+        renderer.add(index, keypoints, angles, self.calibrator.calibration_state(),
+                     self.dashboard_state(exercise_type))
+        
+        reps = self.rep_count(exercise_type)
+        if reps is not None and reps > self._rendered_reps:
+            renderer.mark_event(index)
+        self._rendered_reps = reps
+        
+        # A new max_reach_frame_data means this frame is the best reach so far
+        reach = getattr(self.metrics, 'max_reach_frame_data', None)
+        if reach is not None and reach is not self._rendered_reach:
+            renderer.mark_still(index)
+        self._rendered_reach = reach
+
+    def process_video(self, video_path, exercise_type, save_output=False, batch_size=None,
+                      target_fps=None, stride=None, progress=None, wait_for_output=True,
+                      output_mode='full'):
+        """
+        Process video file and return results.
+        target_fps / stride run the model on every k-th frame only; the frames
+        in between are not decoded and get interpolated keypoints, so the
+        exercise logic still sees every frame.
+        progress(frames_done, total_frames) is called after every frame.
+        The output video is drawn by a DeferredRenderer (self.renderer) on its
+        own thread; with wait_for_output=False the results are returned as
+        soon as scoring ends, while the video may still be rendering.
+        output_mode 'highlights' renders only the reps / jumps (see
+        HighlightRenderer). Sit-and-reach output also gets a still of the
+        maximum reach (self.renderer.still_path).
+        """
+        from datetime import datetime
+        
+        if batch_size is None:
+            batch_size = self.batch_size
+        batch_size = max(1, int(batch_size))
+        
+        self.start_session(exercise_type)
         
         self.log(f"\n{'='*50}")
         self.log(f"Starting {exercise_type.upper()} analysis...")
@@ -686,84 +1046,218 @@ class ExerciseEvaluator:
         if not cap.isOpened():
             raise HTTPException(status_code=400, detail="Could not open video file")
         
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         fps = cap.get(cv2.CAP_PROP_FPS)
+        # Container estimate; 0 when the format does not store it
+        total_frames = max(0, int(cap.get(cv2.CAP_PROP_FRAME_COUNT)))
         
-        output_path = None
-        writer = None
+        stride = self._inference_stride(exercise_type, fps, target_fps, stride)
         
+        # The renderer decodes the video again on its own thread and draws
+        # the records scoring hands it, so scoring never draws or encodes
+        self.renderer = None
         if save_output:
-            output_path = video_path.replace('.mp4', '_processed.avi')
-            fourcc = cv2.VideoWriter_fourcc(*'MJPG')
-            writer = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+            self.renderer = self._start_renderer(video_path, exercise_type, fps, output_mode)
+        renderer = self.renderer
+        
+        # Seen this video with this model before: replay its keypoints
+        # (the renderer still gets every frame's record)
+        cache_key = None
+        if self.keypoint_cache is not None:
+            cache_key = self.keypoint_cache.key(video_path, self.calibrator.model_identity(batch_size), stride)
+            cached = self.keypoint_cache.get(cache_key)
+            if cached is not None:
+                cap.release()
+                keypoints, timestamps = cached
+                try:
+                    result = self.process_keypoint_stream(keypoints, timestamps, exercise_type,
+                                                          progress=progress, source='cached keypoints',
+                                                          renderer=renderer)
+                except BaseException:
+                    if renderer:
+                        renderer.cancel()
+                    raise
+                return result, self._finish_output(wait_for_output)
+        
+        # Keypoints and timestamps of every frame, for the cache
+        recorded_keypoints = []
+        recorded_timestamps = []
+        
+        # Angles for the overlay too when the frames will be drawn
+        features = self.calibrator.overlay_features() if renderer else None
         
         frame_count = 0
         
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            frame, keypoints, angles = self.calibrator.process_frame(frame, show_angles_panel=False)
-            
-            if keypoints is not None:
-                if exercise_type == 'pushup':
-                    self.process_pushup(angles, keypoints)
-                elif exercise_type == 'squat':
-                    self.process_squat(angles, keypoints)
-                elif exercise_type == 'situp':
-                    self.process_situp(angles, keypoints)
-                elif exercise_type == 'sitnreach':
-                    self.process_sitnreach(angles, keypoints)
-                elif exercise_type == 'skipping':
-                    self.process_skipping(angles, keypoints)
-                elif exercise_type == 'jumpingjacks':
-                    self.process_jumpingjacks(angles, keypoints)
-                elif exercise_type == 'vjump':
-                    self.process_vjump(angles, keypoints)
-                elif exercise_type == 'bjump':
-                    self.process_bjump(angles, keypoints)
-            
-            frame = self._draw_dashboard(frame, exercise_type)
-            
-            if writer:
-                writer.write(frame)
-            
-            frame_count += 1
-        
-        cap.release()
-        if writer:
-            writer.release()
+        if stride > 1:
+            self.log(f"Running inference on every {stride} frames (others interpolated)")
+        
+        # Decoding and inference run on pipeline threads, drawing and encoding
+        # on the renderer's; scoring stays on this thread so frames are handled
+        # strictly in order.
+        try:
+            with FramePipeline(cap, self.calibrator, batch_size=batch_size, stride=stride) as pipeline:
+                for frame, keypoints, timestamp in pipeline:
+                    # Handlers run on the video's clock, not the (much faster)
+                    # processing clock, so results do not depend on server speed
+                    current_time = timestamp
+                    
+                    angles = self.calibrator.analyze_keypoints(keypoints, current_time, features)
+                    
+                    if keypoints is not None:
+                        self._process_exercise(exercise_type, angles, keypoints, current_time)
+                    
+                    if renderer:
+                        self._render_frame(renderer, frame_count, keypoints, angles, exercise_type)
+                    
+                    if cache_key:
+                        recorded_keypoints.append(keypoints)
+                        recorded_timestamps.append(timestamp)
+                    
+                    frame_count += 1
+                    if progress:
+                        progress(frame_count, max(total_frames, frame_count))
+        except BaseException:
+            if renderer:
+                renderer.cancel()
+            raise
+        finally:
+            cap.release()
+        
+        if cache_key and recorded_keypoints:
+            # Frames without a person are stored as zero-confidence keypoints
+            stream = np.zeros((len(recorded_keypoints), 17, 3), dtype=np.float32)
+            for i, keypoints in enumerate(recorded_keypoints):
+                if keypoints is not None:
+                    stream[i] = keypoints
+            try:
+                self.keypoint_cache.put(cache_key, stream, recorded_timestamps)
+            except OSError as e:
+                self.log(f"Keypoint cache not updated: {e}")
         
         self.log("\n" + "="*50)
         self.log("Analysis Complete!")
         self.log("="*50)
         
+        if self.calibrator.tracking:
+            stats = self.calibrator.tracking_stats
+            self.log(f"Tracking: {stats['roi']} ROI frames, {stats['fallback']} full-frame fallbacks")
+        
+        if self.calibrator.motion_gate:
+            stats = self.calibrator.gate_stats
+            self.log(f"Motion gate: {stats['gated']} frames reused, {stats['inferred']} inferred")
+        
         # Get metrics
-        result = None
-        if exercise_type == 'pushup':
-            result = self.metrics.pushup_metrics()
-        elif exercise_type == 'squat':
-            result = self.metrics.squat_metrics()
-        elif exercise_type == 'situp':
-            result = self.metrics.situp_metrics()
-        elif exercise_type == 'sitnreach':
-            result = self.metrics.sitnreach_metrics()
-        elif exercise_type == 'skipping':
-            result = self.metrics.skipping_metrics()
-        elif exercise_type == 'jumpingjacks':
-            result = self.metrics.jumpingjacks_metrics()
-        elif exercise_type == 'vjump':
-            result = self.metrics.vjump_metrics()
-        elif exercise_type == 'bjump':
-            result = self.metrics.bjump_metrics()
+        result = self.exercise_metrics(exercise_type)
         
         if result:
             result['timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             result['logs'] = self.logs
         
-        return result, output_path
+        return result, self._finish_output(wait_for_output)
+
+    def _finish_output(self, wait_for_output):
+        """
+        Tell the renderer scoring is done. Returns the output video path: at
+        once (still rendering) with wait_for_output=False, else once written
+        (None if rendering failed).
+        """
+        if self.renderer is None:
+            return None
+        
+        self.renderer.finish()
+        if not wait_for_output:
+            return self.renderer.output_path
+        
+        try:
+            return self.renderer.wait()
+        except Exception as e:
+            self.log(f"Output video not written: {e}")
+            return None
+
+
+def create_session():
+    """
+    A new ExerciseEvaluator for one request: its own counters, metrics, logs
+    and calibration, with inference borrowed from the shared model pool.
+    """
+    return ExerciseEvaluator(backend=model_pool, **session_options)
+
+
+def run_analysis(job, temp_dir, video_path, exercise_type, save_output, target_fps, stride,
+                 output_mode='full'):
+    """
+    Job body: analyse the uploaded video in a new session. The job is done
+    (metrics available) as soon as scoring ends; the output video is
+    published by publish_output_video when its renderer finishes.
+    """
+    rendering = False
+    try:
+        session = create_session()
+        
+        def progress(frames_done, total_frames):
+            job.update_progress(frames_done, total_frames, counter=session.counter,
+                                stage=session.stage, feedback=session.feedback)
+        
+        result, _ = session.process_video(
+            video_path, exercise_type, save_output,
+            target_fps=target_fps, stride=stride, progress=progress, wait_for_output=False,
+            output_mode=output_mode)
+        
+        if session.renderer:
+            job.output_video_status = 'rendering'
+            # The renderer still reads the upload: it removes temp_dir when done
+            session.renderer.add_done_callback(
+                lambda renderer: publish_output_video(job, renderer, temp_dir, output_mode))
+            rendering = True
+        
+        return to_jsonable(result)
+    finally:
+        if not rendering:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def publish_output_video(job, renderer, temp_dir, output_mode='full'):
+    """
+    Renderer callback: copy the output video (and sit-and-reach still) to
+    the download location under names unique to the job.
+    """
+    try:
+        output_path = renderer.wait()
+        # A highlight reel of a video without reps has no frames, so no file
+        if output_path:
+            name = 'highlights' if output_mode == 'highlights' else 'processed'
+            extension = os.path.splitext(output_path)[1]
+            output_filename = f"{job.exercise}_{job.id}_{name}{extension}"
+            shutil.copy(output_path, os.path.join(tempfile.gettempdir(), output_filename))
+            job.output_video_path = output_filename
+        if renderer.still_path:
+            still_filename = f"{job.exercise}_{job.id}_max_reach.jpg"
+            shutil.copy(renderer.still_path, os.path.join(tempfile.gettempdir(), still_filename))
+            job.output_still_path = still_filename
+        job.finish_output_video()
+    except Exception as e:
+        job.finish_output_video(str(e))
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def to_jsonable(value):
+    """Copy of a metrics report with numpy scalars / arrays turned into plain Python values"""
+    if isinstance(value, dict):
+        return {key: to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    return value
+
+
+def remove_job_files(job):
+    """Delete an expired job's processed video and still image"""
+    for filename in (job.output_video_path, job.output_still_path):
+        if filename:
+            file_path = os.path.join(tempfile.gettempdir(), filename)
+            if os.path.exists(file_path):
+                os.remove(file_path)
 
 
 @app.get("/")
@@ -772,7 +1266,11 @@ async def root():
         "message": "AI Exercise Trainer API",
         "version": "1.0.0",
         "endpoints": {
-            "/analyze": "POST - Analyze exercise video",
+            "/analyze": "POST - Queue exercise video analysis (returns a job id)",
+            "/analyze/keypoints": "POST - Score keypoints detected on device (no video, no model)",
+            "/jobs/{job_id}": "GET - Job status, progress and metrics",
+            "/jobs/{job_id}/events": "GET - Live job progress as Server-Sent Events",
+            "/live/{exercise_type}": "WebSocket - Real-time coaching from camera frames or keypoints",
             "/exercises": "GET - List available exercises",
             "/health": "GET - Health check"
         }
@@ -781,7 +1279,7 @@ async def root():
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "model_loaded": evaluator is not None}
+    return {"status": "healthy", "model_loaded": model_pool is not None}
 
 
 @app.get("/exercises")
@@ -800,53 +1298,329 @@ async def list_exercises():
     }
 
 
-@app.post("/analyze")
+@app.post("/analyze", status_code=202)
 async def analyze_exercise(
     video: UploadFile = File(...),
     exercise_type: str = Form(...),
-    save_output: bool = Form(False)
+    save_output: bool = Form(False),
+    target_fps: Optional[float] = Form(None),
+    stride: Optional[int] = Form(None),
+    output_mode: str = Form('full')
 ):
     """
-    Analyze exercise video
+    Queue an exercise video for analysis and return its job id right away.
+    Poll GET /jobs/{job_id} for progress and the final metrics.
     
     - **video**: Video file to analyze
     - **exercise_type**: Type of exercise (pushup, squat, situp, sitnreach, skipping, jumpingjacks, vjump, bjump)
     - **save_output**: Whether to save processed video
+    - **target_fps**: Run pose inference at about this rate (other frames are interpolated)
+    - **stride**: Run pose inference on every stride-th frame (overrides target_fps)
+    - **output_mode**: full (every frame annotated) or highlights (only the reps / jumps)
     """
     
-    if exercise_type not in ['pushup', 'squat', 'situp', 'sitnreach', 'skipping', 'jumpingjacks', 'vjump', 'bjump']:
+    if exercise_type not in EXERCISES:
         raise HTTPException(status_code=400, detail="Invalid exercise type")
+    if output_mode not in OUTPUT_MODES:
+        raise HTTPException(status_code=400, detail="Invalid output mode")
     
-    # Save uploaded video temporarily
+    # Save uploaded video temporarily; the job removes it when done
     temp_dir = tempfile.mkdtemp()
-    video_path = os.path.join(temp_dir, video.filename)
+    video_path = os.path.join(temp_dir, os.path.basename(video.filename or 'video.mp4'))
     
     try:
         with open(video_path, "wb") as buffer:
-            shutil.copyfileobj(video.file, buffer)
-        
-        # Process video
-        result, output_path = evaluator.process_video(video_path, exercise_type, save_output)
-        
-        response = {
-            "success": True,
-            "exercise": exercise_type,
-            "metrics": result,
-            "output_video_available": output_path is not None
-        }
-        
-        # If output video was generated, include download link
-        if output_path and os.path.exists(output_path):
-            # Copy to temp location for download
-            output_filename = f"{exercise_type}_processed.avi"
-            final_output_path = os.path.join(temp_dir, output_filename)
-            shutil.copy(output_path, final_output_path)
-            response["output_video_path"] = output_filename
-        
-        return JSONResponse(content=response)
-    
+            await run_in_threadpool(shutil.copyfileobj, video.file, buffer)
     except Exception as e:
+        shutil.rmtree(temp_dir, ignore_errors=True)
         raise HTTPException(status_code=500, detail=str(e))
+    
+    # Processing runs on a job worker in its own session
+    job = job_queue.submit(exercise_type, run_analysis, temp_dir, video_path, exercise_type,
+                           save_output, target_fps, stride, output_mode)
+    
+    return {
+        "success": True,
+        "job_id": job.id,
+        "exercise": exercise_type,
+        "status": job.status,
+        "status_url": f"/jobs/{job.id}"
+    }
+
+
+def read_array(data, dtype, name):
+    """An uploaded array as dtype: .npy file, or raw little-endian values of dtype"""
+    try:
+        if data[:6] == b'\x93NUMPY':
+            return np.load(BytesIO(data), allow_pickle=False).astype(dtype)
+        return np.frombuffer(data, dtype=np.dtype(dtype).newbyteorder('<')).astype(dtype)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Could not read {name}: {e}")
+
+
+@app.post("/analyze/keypoints")
+async def analyze_keypoints(
+    keypoints: UploadFile = File(...),
+    exercise_type: str = Form(...),
+    timestamps: Optional[UploadFile] = File(None),
+    fps: Optional[float] = Form(None)
+):
+    """
+    Score keypoints detected on the client, without video or server inference
+    
+    - **keypoints**: (T, 17, 3) array of x, y, confidence: raw float32 (little-endian) or .npy
+    - **exercise_type**: Type of exercise (pushup, squat, situp, sitnreach, skipping, jumpingjacks, vjump, bjump)
+    - **timestamps**: (T,) frame times in seconds: raw float64 (little-endian) or .npy
+    - **fps**: Frame rate used for the times when no timestamps are sent (default 30)
+    """
+    
+    if exercise_type not in EXERCISES:
+        raise HTTPException(status_code=400, detail="Invalid exercise type")
+    
+    points = read_array(await keypoints.read(), np.float32, 'keypoints')
+    if points.ndim == 1:
+        if points.size % 51:
+            raise HTTPException(status_code=400, detail="keypoints size is not a multiple of 17 x 3 values")
+        points = points.reshape(-1, 17, 3)
+    if points.ndim != 3 or points.shape[1:] != (17, 3) or len(points) == 0:
+        raise HTTPException(status_code=400, detail=f"keypoints must be (T, 17, 3), got {points.shape}")
+    points = np.nan_to_num(points)
+    
+    if timestamps is not None:
+        times = read_array(await timestamps.read(), np.float64, 'timestamps').ravel()
+        if len(times) != len(points):
+            raise HTTPException(status_code=400,
+                                detail=f"Got {len(times)} timestamps for {len(points)} keypoint frames")
+        if not np.all(np.isfinite(times)):
+            raise HTTPException(status_code=400, detail="timestamps must be finite numbers")
+        if np.any(np.diff(times) < 0):
+            raise HTTPException(status_code=400, detail="timestamps must not decrease")
+    else:
+        times = np.arange(len(points)) / (fps if fps and fps > 0 else 30.0)
+    
+    session = create_session()
+    result = await run_in_threadpool(session.process_keypoint_stream, points, times, exercise_type)
+    
+    return {
+        "success": True,
+        "exercise": exercise_type,
+        "frames": len(points),
+        "metrics": to_jsonable(result)
+    }
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Status, progress (frames done / total) and, once done, the metrics of a job"""
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return job.to_dict()
+
+
+# Seconds between progress events on /jobs/{job_id}/events
+EVENT_INTERVAL = 0.25
+
+
+def sse_event(event, data):
+    """One Server-Sent Events message with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def job_events(job):
+    """
+    Progress events while the job is queued / running (only when something
+    changed), then metrics (the report) or error as the last event. With an
+    output video, metrics waits for it to be ready (or failed) and carries
+    its status under output_video.
+    """
+    last = None
+    while job.status in ('queued', 'running'):
+        event = job.progress_event()
+        if event != last:
+            yield sse_event('progress', event)
+            last = event
+        await asyncio.sleep(EVENT_INTERVAL)
+    
+    # Last progress (all frames), then the result
+    yield sse_event('progress', job.progress_event())
+    if job.status != 'done':
+        yield sse_event('error', {'error': job.error})
+        return
+    
+    result = job.result
+    if job.output_video_status is not None:
+        while job.output_video_status == 'rendering':
+            await asyncio.sleep(EVENT_INTERVAL)
+        result = dict(result or {}, output_video=job.output_video_event())
+    yield sse_event('metrics', result)
+
+
+@app.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """
+    Stream a job's progress as Server-Sent Events: frames processed, fps,
+    rep counter, stage and feedback, ending with the final metrics.
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return StreamingResponse(job_events(job), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+# Frames a live connection keeps waiting; when more arrive the oldest is dropped
+LIVE_MAX_IN_FLIGHT = 2
+
+# Parsed {"action": "finish"} message: send the final metrics and close
+LIVE_FINISH = object()
+
+
+def parse_live_message(message):
+    """
+    Parse a live WebSocket message: ('frame', jpeg_bytes, None),
+    ('keypoints', array_or_None, timestamp), LIVE_FINISH or ('error', detail).
+    """
+    if message.get('bytes') is not None:
+        return ('frame', message['bytes'], None)
+    
+    try:
+        data = json.loads(message.get('text') or '')
+    except ValueError:
+        return ('error', "Expected a JPEG frame or a JSON message")
+    if not isinstance(data, dict):
+        return ('error', "Expected a JSON object")
+    
+    if data.get('action') == 'finish':
+        return LIVE_FINISH
+    if 'keypoints' not in data:
+        return ('error', "JSON messages need 'keypoints' or 'action'")
+    
+    keypoints = data['keypoints']
+    if keypoints is not None:
+        try:
+            keypoints = np.asarray(keypoints, dtype=np.float32)
+        except (TypeError, ValueError):
+            keypoints = None
+        if keypoints is None or keypoints.shape != (17, 3):
+            return ('error', "keypoints must be 17 [x, y, confidence] triples or null")
+    
+    # Handlers do arithmetic on it, so only a finite number (or none) will do
+    timestamp = data.get('timestamp')
+    if timestamp is not None and (isinstance(timestamp, bool) or not isinstance(timestamp, (int, float))
+                                  or not np.isfinite(timestamp)):
+        return ('error', "timestamp must be a number")
+    
+    return ('keypoints', keypoints, timestamp)
+
+
+def score_live_item(session, exercise_type, item):
+    """Decode (for JPEG frames) and score one live frame on a worker thread"""
+    kind, payload, timestamp = item
+    if kind == 'keypoints':
+        return session.score_frame(exercise_type, keypoints=payload, current_time=timestamp)
+    
+    frame = cv2.imdecode(np.frombuffer(payload, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if frame is None:
+        return None
+    return session.score_frame(exercise_type, frame=frame)
+
+
+@app.websocket("/live/{exercise_type}")
+async def live_coaching(websocket: WebSocket, exercise_type: str):
+    """
+    Real-time coaching, one session per connection.
+    
+    Send JPEG frames as binary messages, or keypoints already detected on
+    the device as JSON: {"keypoints": [[x, y, conf] x 17] or null,
+    "timestamp": seconds}. Every scored frame is answered with counter,
+    stage, feedback and rep events. {"action": "finish"} returns the final
+    metrics and closes. Frames that arrive while LIVE_MAX_IN_FLIGHT are
+    already waiting replace the oldest waiting one, so feedback stays live.
+    """
+    if exercise_type not in EXERCISES:
+        await websocket.close(code=1008, reason="Invalid exercise type")
+        return
+    
+    await websocket.accept()
+    session = create_session()
+    session.start_session(exercise_type)
+    
+    # Frames waiting to be scored (at most LIVE_MAX_IN_FLIGHT), and replies
+    # to bad messages; the receiver fills them and wakes the scoring loop
+    frames = deque()
+    errors = []
+    wake = asyncio.Event()
+    received = 0
+    dropped = 0
+    finish = False
+    disconnected = False
+    
+    async def receive_frames():
+        nonlocal received, dropped, finish, disconnected
+        try:
+            while not finish:
+                message = await websocket.receive()
+                if message['type'] == 'websocket.disconnect':
+                    break
+                
+                item = parse_live_message(message)
+                if item is LIVE_FINISH:
+                    finish = True
+                elif item[0] == 'error':
+                    errors.append(item[1])
+                else:
+                    received += 1
+                    # Drop the stalest waiting frame rather than fall behind
+                    if len(frames) >= LIVE_MAX_IN_FLIGHT:
+                        frames.popleft()
+                        dropped += 1
+                    frames.append(item + (received,))
+                wake.set()
+        finally:
+            disconnected = not finish
+            wake.set()
+    
+    receiver = asyncio.create_task(receive_frames())
+    try:
+        while True:
+            await wake.wait()
+            wake.clear()
+            
+            while errors and not disconnected:
+                await websocket.send_json({'type': 'error', 'detail': errors.pop(0)})
+            
+            while frames and not disconnected:
+                kind, payload, timestamp, index = frames.popleft()
+                try:
+                    update = await run_in_threadpool(score_live_item, session, exercise_type,
+                                                     (kind, payload, timestamp))
+                except Exception as e:
+                    # One bad frame must not end the session
+                    await websocket.send_json({'type': 'error', 'frame': index,
+                                               'detail': f"Could not score frame: {e}"})
+                    continue
+                if update is None:
+                    await websocket.send_json({'type': 'error', 'frame': index,
+                                               'detail': "Could not decode JPEG frame"})
+                    continue
+                
+                update.update({'type': 'frame', 'frame': index, 'dropped': dropped})
+                await websocket.send_json(update)
+            
+            if disconnected:
+                break
+            if finish and not frames:
+                result = await run_in_threadpool(session.exercise_metrics, exercise_type)
+                await websocket.send_json({'type': 'metrics', 'metrics': to_jsonable(result)})
+                await websocket.close()
+                break
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
 
 
 @app.get("/download/{filename}")
@@ -858,7 +1632,9 @@ async def download_processed_video(filename: str):
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="File not found")
     
-    return FileResponse(file_path, media_type="video/x-msvideo", filename=filename)
+    media_types = {'.mp4': "video/mp4", '.jpg': "image/jpeg"}
+    media_type = media_types.get(os.path.splitext(filename)[1], "video/x-msvideo")
+    return FileResponse(file_path, media_type=media_type, filename=filename)
 
 
 if __name__ == "__main__":
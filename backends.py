@@ -0,0 +1,425 @@
+import os
+import queue
+from contextlib import contextmanager
+
+import cv2
+import numpy as np
+
+
+class UltralyticsBackend:
+    """
+    Runs the YOLOv8 pose model through ultralytics / PyTorch.
+    """
+
+    name = 'torch'
+
+    def __init__(self, model_path='yolov8n-pose.pt', imgsz=640):
+        from ultralytics import YOLO
+
+        self.model_path = model_path
+        self.imgsz = imgsz
+        self.model = YOLO(model_path)
+
+
+    def predict(self, frames, imgsz=None):
+        """Return one (17, 3) keypoint array (or None) per frame"""
+        if not frames:
+            return []
+
+        # ultralytics letterboxes to imgsz and scales keypoints back to each frame
+        results = self.model(frames, imgsz=imgsz or self.imgsz, verbose=False)
+
+        return [self._extract_keypoints(result) for result in results]
+
+
+    def _extract_keypoints(self, result):
+        """Return the (17, 3) keypoints of the first detected person, or None"""
+        if len(result.keypoints) > 0:
+            keypoints = result.keypoints.data[0].cpu().numpy()
+            return keypoints
+
+        return None
+
+
+class OnnxPoseBackend:
+    """
+    Runs an ONNX export of the YOLOv8 pose model through onnxruntime on CPU.
+
+    The .pt model is exported once and the .onnx file is cached on disk.
+    Preprocessing (letterbox) and decoding (confidence filter + NMS) are done
+    here, and keypoints are mapped back to source-frame coordinates so
+    predict() returns the same (17, 3) arrays as the PyTorch backend.
+
+    quantize='dynamic' or 'static' runs an INT8 copy of the exported model
+    instead (see quantize_onnx); static quantization needs calibration_videos.
+    """
+
+    name = 'onnx'
+
+    def __init__(self, model_path='yolov8n-pose.pt', imgsz=640, conf_threshold=0.25,
+                 iou_threshold=0.7, cache_dir=None, num_threads=None,
+                 quantize=None, calibration_videos=None):
+        import onnxruntime as ort
+
+        self.model_path = model_path
+        self.imgsz = imgsz
+        self.conf_threshold = conf_threshold
+        self.iou_threshold = iou_threshold
+        self.quantize = quantize
+        self.onnx_path = export_onnx(model_path, imgsz=imgsz, cache_dir=cache_dir)
+
+        if quantize:
+            self.onnx_path = quantize_onnx(self.onnx_path, mode=quantize, imgsz=imgsz,
+                                           calibration_videos=calibration_videos)
+
+        options = ort.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+
+        self.session = ort.InferenceSession(self.onnx_path, options,
+                                            providers=['CPUExecutionProvider'])
+        self.input_name = self.session.get_inputs()[0].name
+
+
+    def predict(self, frames, imgsz=None):
+        """
+        Return one (17, 3) keypoint array (or None) per frame. imgsz overrides
+        the input size for this call (the export has dynamic axes).
+        """
+        if not frames:
+            return []
+
+        batch, letterboxed = preprocess(frames, imgsz or self.imgsz)
+        output = self.session.run(None, {self.input_name: batch})[0]
+
+        keypoints = []
+        for i, frame in enumerate(frames):
+            _, gain, pad = letterboxed[i]
+            keypoints.append(self._decode(output[i], gain, pad, frame.shape[:2]))
+
+        return keypoints
+
+
+    def _decode(self, prediction, gain, pad, frame_shape):
+        """Decode one image's raw (56, anchors) output into the top person's keypoints"""
+        # Rows: cx, cy, w, h, person score, then 17 x (x, y, visibility)
+        prediction = prediction.T
+        scores = prediction[:, 4]
+
+        candidates = scores > self.conf_threshold
+        if not np.any(candidates):
+            return None
+
+        prediction = prediction[candidates]
+        scores = scores[candidates]
+
+        boxes = np.empty((len(prediction), 4), dtype=np.float32)
+        boxes[:, 0] = prediction[:, 0] - prediction[:, 2] / 2
+        boxes[:, 1] = prediction[:, 1] - prediction[:, 3] / 2
+        boxes[:, 2] = prediction[:, 0] + prediction[:, 2] / 2
+        boxes[:, 3] = prediction[:, 1] + prediction[:, 3] / 2
+
+        keep = non_max_suppression(boxes, scores, self.iou_threshold)
+
+        # Detections are ordered by score, so the first one is "the" person
+        keypoints = prediction[keep[0], 5:].reshape(17, 3).copy()
+
+        h, w = frame_shape
+        keypoints[:, 0] = np.clip((keypoints[:, 0] - pad[0]) / gain, 0, w)
+        keypoints[:, 1] = np.clip((keypoints[:, 1] - pad[1]) / gain, 0, h)
+
+        return keypoints.astype(np.float32)
+
+
+class QuantizedOnnxPoseBackend(OnnxPoseBackend):
+    """
+    INT8 variant of the ONNX backend. Uses static quantization when
+    calibration videos are given and dynamic quantization otherwise.
+    """
+
+    name = 'onnx-int8'
+
+    def __init__(self, model_path='yolov8n-pose.pt', quantize=None, calibration_videos=None, **kwargs):
+        if quantize is None:
+            quantize = 'static' if calibration_videos else 'dynamic'
+
+        super().__init__(model_path=model_path, quantize=quantize,
+                         calibration_videos=calibration_videos, **kwargs)
+
+
+class VideoCalibrationReader:
+    """
+    Feeds frames sampled evenly from exercise videos to onnxruntime's static
+    quantization calibrator, preprocessed exactly like OnnxPoseBackend input.
+    """
+
+    def __init__(self, input_name, video_paths, imgsz=640, num_frames=64):
+        self.input_name = input_name
+        self.imgsz = imgsz
+        self.frames = sample_video_frames(video_paths, num_frames)
+        self._index = 0
+
+        if not self.frames:
+            raise ValueError("No frames could be read from the calibration videos")
+
+
+    def get_next(self):
+        """Return the next {input_name: batch} feed, or None when exhausted"""
+        if self._index >= len(self.frames):
+            return None
+
+        batch, _ = preprocess([self.frames[self._index]], self.imgsz)
+        self._index += 1
+
+        return {self.input_name: batch}
+
+
+    def rewind(self):
+        self._index = 0
+
+
+def sample_video_frames(video_paths, num_frames=64):
+    """Read about num_frames frames spread evenly across all given videos"""
+    per_video = max(1, num_frames // max(1, len(video_paths)))
+    frames = []
+
+    for video_path in video_paths:
+        cap = cv2.VideoCapture(video_path)
+        total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+        if total > 0:
+            wanted = set(np.linspace(0, total - 1, per_video).astype(int).tolist())
+        else:
+            wanted = set(range(per_video))
+
+        index = 0
+        while len(wanted) > 0:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            if index in wanted:
+                frames.append(frame)
+                wanted.discard(index)
+            index += 1
+
+        cap.release()
+
+    return frames
+
+
+def preprocess(frames, imgsz):
+    """
+    Letterbox BGR frames into one RGB NCHW float32 batch in [0, 1].
+    Returns (batch, [(image, gain, pad), ...]).
+    """
+    letterboxed = [letterbox(frame, imgsz) for frame in frames]
+
+    batch = np.stack([image for image, _, _ in letterboxed])
+    batch = batch[..., ::-1].transpose(0, 3, 1, 2)
+    batch = np.ascontiguousarray(batch, dtype=np.float32) / 255.0
+
+    return batch, letterboxed
+
+
+def letterbox(frame, imgsz, color=(114, 114, 114)):
+    """
+    Resize a frame to fit an imgsz x imgsz square, keeping aspect ratio, and
+    pad the remainder. Returns (image, gain, (pad_x, pad_y)).
+    """
+    h, w = frame.shape[:2]
+    gain = min(imgsz / h, imgsz / w)
+    new_w, new_h = int(round(w * gain)), int(round(h * gain))
+
+    if (new_w, new_h) != (w, h):
+        frame = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+
+    pad_x = (imgsz - new_w) / 2
+    pad_y = (imgsz - new_h) / 2
+    top, bottom = int(round(pad_y - 0.1)), int(round(pad_y + 0.1))
+    left, right = int(round(pad_x - 0.1)), int(round(pad_x + 0.1))
+
+    image = cv2.copyMakeBorder(frame, top, bottom, left, right,
+                               cv2.BORDER_CONSTANT, value=color)
+
+    return image, gain, (left, top)
+
+
+def non_max_suppression(boxes, scores, iou_threshold):
+    """Greedy NMS over (N, 4) xyxy boxes; returns kept indices, best score first"""
+    x1, y1, x2, y2 = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    areas = np.maximum(0, x2 - x1) * np.maximum(0, y2 - y1)
+    order = np.argsort(-scores)
+
+    keep = []
+    while order.size > 0:
+        best = order[0]
+        keep.append(best)
+
+        rest = order[1:]
+        inter_w = np.maximum(0, np.minimum(x2[best], x2[rest]) - np.maximum(x1[best], x1[rest]))
+        inter_h = np.maximum(0, np.minimum(y2[best], y2[rest]) - np.maximum(y1[best], y1[rest]))
+        inter = inter_w * inter_h
+        iou = inter / (areas[best] + areas[rest] - inter + 1e-7)
+
+        order = rest[iou <= iou_threshold]
+
+    return keep
+
+
+def export_onnx(model_path, imgsz=640, cache_dir=None):
+    """
+    Export a YOLOv8 .pt model to ONNX once and return the cached file path.
+    The export is redone only when the .pt file is newer than the cached copy.
+    """
+    stem = os.path.splitext(os.path.basename(model_path))[0]
+    cache_dir = cache_dir or os.path.dirname(os.path.abspath(model_path))
+    onnx_path = os.path.join(cache_dir, f"{stem}-{imgsz}.onnx")
+
+    if os.path.exists(onnx_path) and (
+            not os.path.exists(model_path) or
+            os.path.getmtime(onnx_path) >= os.path.getmtime(model_path)):
+        return onnx_path
+
+    from ultralytics import YOLO
+
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # Dynamic axes so several frames can be sent in one run() call
+    exported = YOLO(model_path).export(format='onnx', imgsz=imgsz, dynamic=True)
+    os.replace(exported, onnx_path)
+    print(f"✓ Exported {model_path} to {onnx_path}")
+
+    return onnx_path
+
+
+def quantize_onnx(onnx_path, mode='dynamic', imgsz=640, calibration_videos=None,
+                  num_calibration_frames=64):
+    """
+    Write an INT8 copy of an exported ONNX model and return its path.
+
+    mode='dynamic' quantizes weights only and computes activation ranges at
+    run time. mode='static' also fixes activation ranges, calibrated on
+    frames sampled from calibration_videos (our own exercise recordings).
+    The quantized file is cached next to the float model and rebuilt when the
+    float model is newer; delete it to recalibrate on different videos.
+    """
+    if mode not in ('dynamic', 'static'):
+        raise ValueError(f"Unknown quantization mode '{mode}'. Choose from: dynamic, static")
+
+    int8_path = f"{os.path.splitext(onnx_path)[0]}-int8-{mode}.onnx"
+
+    if os.path.exists(int8_path) and os.path.getmtime(int8_path) >= os.path.getmtime(onnx_path):
+        return int8_path
+
+    import onnx
+    from onnxruntime.quantization import (CalibrationMethod, QuantFormat, QuantType,
+                                          quantize_dynamic, quantize_static)
+
+    # Keep the head's box/keypoint decoding (grid offsets, strides, sigmoid
+    # scaling) in float: quantizing it costs whole pixels of keypoint error.
+    # The head's convolutions (/model.22/cv2, cv3, cv4) are still quantized.
+    graph = onnx.load(onnx_path).graph
+    decode_nodes = [node.name for node in graph.node
+                    if node.name.startswith('/model.22/') and not node.name.startswith('/model.22/cv')]
+
+    if mode == 'dynamic':
+        quantize_dynamic(onnx_path, int8_path, weight_type=QuantType.QUInt8,
+                         nodes_to_exclude=decode_nodes)
+    else:
+        if not calibration_videos:
+            raise ValueError("Static quantization needs calibration_videos")
+
+        reader = VideoCalibrationReader(graph.input[0].name, calibration_videos,
+                                        imgsz=imgsz, num_frames=num_calibration_frames)
+        quantize_static(onnx_path, int8_path, reader,
+                        quant_format=QuantFormat.QDQ,
+                        activation_type=QuantType.QUInt8,
+                        weight_type=QuantType.QInt8,
+                        per_channel=True,
+                        calibrate_method=CalibrationMethod.MinMax,
+                        nodes_to_exclude=decode_nodes)
+
+    print(f"✓ Quantized {onnx_path} to {int8_path} ({mode})")
+
+    return int8_path
+
+
+BACKENDS = {
+    'torch': UltralyticsBackend,
+    'onnx': OnnxPoseBackend,
+    'onnx-int8': QuantizedOnnxPoseBackend,
+}
+
+
+def create_backend(name='torch', model_path='yolov8n-pose.pt', **kwargs):
+    """Build an inference backend by name ('torch', 'onnx' or 'onnx-int8')"""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown pose backend '{name}'. Choose from: {', '.join(BACKENDS)}")
+
+    return BACKENDS[name](model_path=model_path, **kwargs)
+
+
+def backend_identity(backend):
+    """
+    Name of the model a backend (or pool) runs, for caching its outputs:
+    backend type, weights file (with size and mtime, so a replaced file
+    counts as a new model) and input size.
+    """
+    backend = getattr(backend, 'backends', [backend])[0]
+    weights = getattr(backend, 'onnx_path', None) or getattr(backend, 'model_path', None) or ''
+
+    version = ''
+    if weights and os.path.exists(weights):
+        stat = os.stat(weights)
+        version = f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    return f"{backend.name}|{os.path.basename(weights)}|{version}|imgsz={getattr(backend, 'imgsz', 640)}"
+
+
+class BackendPool:
+    """
+    A fixed set of interchangeable backends shared by concurrent sessions.
+
+    predict() borrows a free backend for the length of one call, blocking
+    while all of them are busy, so a pool can be passed anywhere a single
+    backend is expected (e.g. PoseCalibrator(backend=pool)). Each backend
+    only ever runs one call at a time.
+    """
+
+    def __init__(self, backends):
+        self.backends = list(backends)
+        if not self.backends:
+            raise ValueError("BackendPool needs at least one backend")
+
+        self.name = self.backends[0].name
+        self.imgsz = getattr(self.backends[0], 'imgsz', 640)
+
+        self._free = queue.Queue()
+        for backend in self.backends:
+            self._free.put(backend)
+
+
+    def __len__(self):
+        return len(self.backends)
+
+
+    @contextmanager
+    def borrow(self):
+        """Hold one backend exclusively inside the with-block"""
+        backend = self._free.get()
+        try:
+            yield backend
+        finally:
+            self._free.put(backend)
+
+
+    def predict(self, frames, imgsz=None):
+        """Run one predict() call on whichever backend is free first"""
+        with self.borrow() as backend:
+            return backend.predict(frames, imgsz=imgsz)
+
+
+def create_backend_pool(name='torch', model_path='yolov8n-pose.pt', size=1, **kwargs):
+    """Load size copies of a backend (see create_backend) into a BackendPool"""
+    return BackendPool(create_backend(name, model_path=model_path, **kwargs)
+                       for _ in range(max(1, int(size))))
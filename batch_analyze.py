@@ -0,0 +1,234 @@
+"""
+Analyse a directory (or manifest) of exercise videos on a pool of processes.
+
+Videos are fanned out over worker processes. Each worker loads the pose
+model once and limits torch / BLAS / OpenCV / onnxruntime to --threads
+threads, so W workers keep to about W * threads cores instead of each one
+trying to use all of them. Every result (or error) is appended to a JSONL
+file as soon as its video is done, and a throughput summary (videos/hour,
+frames/s per core) is printed at the end.
+
+Usage:
+    python batch_analyze.py --videos path/to/videos --output results.jsonl
+    python batch_analyze.py --manifest test_day.csv --workers 4 --threads 2
+
+In a directory (searched recursively), the exercise is taken from the file
+name prefix (pushup_01.mp4, squat.mp4, ...) or else from the name of the
+folder the video is in (pushup/student_17.mp4). A manifest is a CSV of
+video,exercise_type lines; relative video paths are relative to the
+manifest and an optional header line is skipped.
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import cv2
+
+from app import EXERCISES, OUTPUT_MODES, ExerciseEvaluator, to_jsonable
+from backends import create_backend
+
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv')
+
+# Thread pools sized from the environment when the libraries load
+THREAD_ENV_VARS = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS')
+
+# Set in each worker process by init_worker
+_backend = None
+_evaluator_options = {}
+_video_options = {}
+
+
+def exercise_for(video_path):
+    """Exercise of a video from its file name prefix or its folder name, or None"""
+    filename = os.path.basename(video_path).lower()
+    folder = os.path.basename(os.path.dirname(os.path.abspath(video_path))).lower()
+    for exercise in EXERCISES:
+        if filename.startswith(exercise):
+            return exercise
+    return folder if folder in EXERCISES else None
+
+
+def find_tasks(video_dir):
+    """(video, exercise) for every video under video_dir, plus the videos with no exercise"""
+    tasks, unmatched = [], []
+    for root, dirs, files in os.walk(video_dir):
+        dirs.sort()
+        for filename in sorted(files):
+            if not filename.lower().endswith(VIDEO_EXTENSIONS):
+                continue
+            # Our own output videos are not inputs
+            if os.path.splitext(filename)[0].endswith(('_processed', '_highlights')):
+                continue
+            video_path = os.path.join(root, filename)
+            exercise = exercise_for(video_path)
+            if exercise:
+                tasks.append((video_path, exercise))
+            else:
+                unmatched.append(video_path)
+    return tasks, unmatched
+
+
+def read_manifest(manifest_path):
+    """(video, exercise) pairs from a video,exercise_type CSV"""
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    tasks = []
+    with open(manifest_path, newline='', encoding='utf-8') as f:
+        for line_number, row in enumerate(csv.reader(f), 1):
+            row = [value.strip() for value in row]
+            if not row or not row[0] or row[0].startswith('#'):
+                continue
+            if line_number == 1 and row[:2] == ['video', 'exercise_type']:
+                continue
+            if len(row) < 2 or row[1] not in EXERCISES:
+                raise SystemExit(f"{manifest_path}:{line_number}: expected video,exercise_type "
+                                 f"with exercise_type one of {', '.join(EXERCISES)}")
+            tasks.append((os.path.join(base_dir, row[0]), row[1]))
+    return tasks
+
+
+def init_worker(backend, model_path, imgsz, threads, evaluator_options, video_options):
+    """Process pool initializer: cap thread pools and load this worker's model once"""
+    global _backend, _evaluator_options, _video_options
+
+    cv2.setNumThreads(threads)
+    backend_options = {'imgsz': imgsz}
+    if backend == 'torch':
+        import torch
+        torch.set_num_threads(threads)
+    else:
+        backend_options['num_threads'] = threads
+
+    _backend = create_backend(backend, model_path=model_path, **backend_options)
+    _evaluator_options = evaluator_options
+    _video_options = video_options
+
+
+def analyze_video(video_path, exercise_type):
+    """Worker: analyse one video; returns its JSONL record (errors included, never raised)"""
+    evaluator = ExerciseEvaluator(backend=_backend, **_evaluator_options)
+
+    frames = 0
+
+    def progress(frames_done, total_frames):
+        nonlocal frames
+        frames = frames_done
+
+    record = {'video': video_path, 'exercise': exercise_type}
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result, output_path = evaluator.process_video(video_path, exercise_type, progress=progress,
+                                                          **_video_options)
+        result = to_jsonable(result) or {}
+        result.pop('logs', None)
+        record.update(status='ok', metrics=result)
+        if output_path:
+            record['output_video'] = output_path
+    except Exception as e:
+        record.update(status='error', error=getattr(e, 'detail', None) or str(e))
+
+    seconds = time.perf_counter() - start
+    record.update(frames=frames, seconds=round(seconds, 3),
+                  fps=round(frames / seconds, 1) if seconds > 0 else 0.0)
+    return record
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyse many exercise videos in parallel")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--videos', help="Directory of videos (exercise from file or folder name)")
+    source.add_argument('--manifest', help="CSV of video,exercise_type lines")
+    parser.add_argument('--output', default='results.jsonl', help="JSONL file the results are appended to")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes (default: CPU cores / threads)")
+    parser.add_argument('--threads', type=int, default=1, help="Inference threads per worker")
+    parser.add_argument('--backend', default='torch', help="torch, onnx or onnx-int8")
+    parser.add_argument('--model', default='yolov8n-pose.pt')
+    parser.add_argument('--imgsz', type=int, default=640)
+    parser.add_argument('--batch-size', type=int, default=8)
+    parser.add_argument('--target-fps', type=float, default=None)
+    parser.add_argument('--stride', type=int, default=None)
+    parser.add_argument('--tracking', action='store_true')
+    parser.add_argument('--motion-gate', action='store_true')
+    parser.add_argument('--save-output', action='store_true',
+                        help="Write annotated videos next to the inputs")
+    parser.add_argument('--output-mode', default='full', choices=OUTPUT_MODES)
+    args = parser.parse_args()
+
+    if args.videos:
+        tasks, unmatched = find_tasks(args.videos)
+        for video_path in unmatched:
+            print(f"⚠ No exercise in the name of {video_path}, skipped")
+    else:
+        tasks = read_manifest(args.manifest)
+    if not tasks:
+        raise SystemExit("No videos to analyse")
+
+    threads = max(1, args.threads)
+    workers = args.workers or max(1, (os.cpu_count() or 1) // threads)
+    workers = max(1, min(workers, len(tasks)))
+
+    # Workers inherit these, so BLAS / OpenMP size their pools before loading
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(threads)
+
+    if args.backend != 'torch':
+        # Export / quantize here once, so the workers find the model cached
+        # instead of all writing it at the same time
+        create_backend(args.backend, model_path=args.model, imgsz=args.imgsz)
+
+    evaluator_options = {
+        'batch_size': args.batch_size,
+        'tracking': args.tracking,
+        'motion_gate': args.motion_gate,
+    }
+    video_options = {
+        'save_output': args.save_output,
+        'output_mode': args.output_mode,
+        'target_fps': args.target_fps,
+        'stride': args.stride,
+    }
+
+    print(f"Analysing {len(tasks)} videos on {workers} workers x {threads} threads ({args.backend} backend)")
+
+    done = failed = frames = 0
+    start = time.perf_counter()
+    # spawn: fresh workers, not forks of a process that already runs threads
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                             initializer=init_worker,
+                             initargs=(args.backend, args.model, args.imgsz, threads,
+                                       evaluator_options, video_options)) as pool, \
+            open(args.output, 'a', encoding='utf-8') as output:
+        futures = [pool.submit(analyze_video, video_path, exercise) for video_path, exercise in tasks]
+        for future in as_completed(futures):
+            record = future.result()
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+
+            done += 1
+            frames += record['frames']
+            if record['status'] != 'ok':
+                failed += 1
+                print(f"[{done}/{len(tasks)}] ✗ {record['video']}: {record['error']}")
+            else:
+                print(f"[{done}/{len(tasks)}] {record['video']} ({record['exercise']}): "
+                      f"{record['frames']} frames, {record['fps']} fps")
+
+    elapsed = time.perf_counter() - start
+    cores = workers * threads
+    print("\n" + "=" * 60)
+    print(f"Videos: {done - failed} analysed, {failed} failed, in {elapsed:.1f}s")
+    print(f"Throughput: {3600.0 * done / elapsed:.0f} videos/hour, {frames / elapsed:.1f} frames/s "
+          f"({frames / elapsed / cores:.1f} frames/s per core, {cores} cores)")
+    print(f"✓ Results appended to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
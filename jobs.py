@@ -0,0 +1,212 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Job:
+    """
+    One queued video analysis and everything a client can ask about it.
+
+    status goes queued -> running -> done (or failed). While running, the
+    worker reports frames_done / total_frames and the session's live rep
+    counter, stage and feedback through update_progress().
+
+    The output video is rendered after scoring, so it has a status of its
+    own: output_video_status is None (not requested), rendering, ready or
+    failed; a job can be done while its video is still rendering. A
+    sit-and-reach job also gets a still of the maximum reach
+    (output_still_path).
+    """
+
+    def __init__(self, exercise):
+        self.id = uuid.uuid4().hex
+        self.exercise = exercise
+        self.status = 'queued'
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+
+        self.frames_done = 0
+        self.total_frames = 0
+        self.counter = 0
+        self.stage = None
+        self.feedback = None
+
+        self.result = None
+        self.output_video_status = None
+        self.output_video_path = None
+        self.output_still_path = None
+        self.output_video_error = None
+        self.output_video_finished = None
+        self.error = None
+
+
+    def update_progress(self, frames_done, total_frames, counter=0, stage=None, feedback=None):
+        self.frames_done = frames_done
+        self.total_frames = total_frames
+        self.counter = counter
+        self.stage = stage
+        self.feedback = feedback
+
+
+    @property
+    def progress(self):
+        """Share of the video processed, 0..1 (None while the length is unknown)"""
+        if self.status == 'done':
+            return 1.0
+        if self.total_frames <= 0:
+            return None
+        return min(1.0, self.frames_done / self.total_frames)
+
+
+    @property
+    def fps(self):
+        """Frames processed per second since the job started"""
+        if self.started is None:
+            return 0.0
+        elapsed = (self.finished or time.time()) - self.started
+        return self.frames_done / elapsed if elapsed > 0 else 0.0
+
+
+    def progress_event(self):
+        """Live progress of a running job, as sent in progress events"""
+        progress = self.progress
+        return {
+            'status': self.status,
+            'frames_done': self.frames_done,
+            'total_frames': self.total_frames,
+            'progress': round(progress, 4) if progress is not None else None,
+            'fps': round(self.fps, 1),
+            'counter': self.counter,
+            'stage': self.stage,
+            'feedback': self.feedback,
+        }
+
+
+    def finish_output_video(self, error=None):
+        """Rendering ended: the output video is ready, or failed with error"""
+        self.output_video_finished = time.time()
+        self.output_video_error = error
+        self.output_video_status = 'failed' if error else 'ready'
+
+
+    def retained_since(self):
+        """When the retention period starts: once the job and its output video are done"""
+        if self.finished is None or self.output_video_status == 'rendering':
+            return None
+        return max(self.finished, self.output_video_finished or 0)
+
+
+    def output_video_event(self):
+        """Output video status, as sent in the output_video event"""
+        event = {'status': self.output_video_status}
+        if self.output_video_path:
+            event['output_video_path'] = self.output_video_path
+        if self.output_still_path:
+            event['output_still_path'] = self.output_still_path
+        if self.output_video_error:
+            event['error'] = self.output_video_error
+        return event
+
+
+    def to_dict(self):
+        """JSON-ready status; metrics only once the job is done"""
+        progress = self.progress
+        status = {
+            'job_id': self.id,
+            'exercise': self.exercise,
+            'status': self.status,
+            'frames_done': self.frames_done,
+            'total_frames': self.total_frames,
+            'progress': round(progress, 4) if progress is not None else None,
+        }
+
+        if self.status == 'done':
+            status['metrics'] = self.result
+            status['output_video_available'] = self.output_video_path is not None
+            if self.output_video_status:
+                status['output_video_status'] = self.output_video_status
+            if self.output_video_path:
+                status['output_video_path'] = self.output_video_path
+            if self.output_still_path:
+                status['output_still_path'] = self.output_still_path
+            if self.output_video_error:
+                status['output_video_error'] = self.output_video_error
+        elif self.status == 'failed':
+            status['error'] = self.error
+        return status
+
+
+class JobQueue:
+    """
+    Runs analysis jobs on a fixed number of worker threads.
+
+    submit() returns immediately with a queued Job; the work function is
+    called as func(job, *args) on a worker and its return value becomes
+    job.result. Finished jobs are kept for `retention` seconds, then dropped
+    (on_expire(job) is called so their files can be removed).
+    """
+
+    def __init__(self, workers=2, retention=3600, on_expire=None):
+        self.retention = retention
+        self.on_expire = on_expire
+
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(workers)),
+                                            thread_name_prefix='analysis-job')
+
+
+    def submit(self, exercise, func, *args):
+        """Queue func(job, *args) and return the new Job"""
+        self.purge_expired()
+
+        job = Job(exercise)
+        with self._lock:
+            self._jobs[job.id] = job
+
+        self._executor.submit(self._run, job, func, args)
+        return job
+
+
+    def get(self, job_id):
+        """The Job with this id, or None if unknown or expired"""
+        self.purge_expired()
+        with self._lock:
+            return self._jobs.get(job_id)
+
+
+    def purge_expired(self):
+        """Drop finished jobs older than the retention period (counted from the end of rendering)"""
+        if self.retention is None:
+            return
+
+        cutoff = time.time() - self.retention
+        with self._lock:
+            expired = [job for job in self._jobs.values()
+                       if job.retained_since() is not None and job.retained_since() < cutoff]
+            for job in expired:
+                del self._jobs[job.id]
+
+        if self.on_expire:
+            for job in expired:
+                self.on_expire(job)
+
+
+    def shutdown(self, wait=True):
+        """Stop taking jobs; with wait=True, finish the running and queued ones first"""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+    def _run(self, job, func, args):
+        job.status = 'running'
+        job.started = time.time()
+        try:
+            job.result = func(job, *args)
+            job.status = 'done'
+        except Exception as e:
+            job.error = getattr(e, 'detail', None) or str(e)
+            job.status = 'failed'
+        finally:
+            job.finished = time.time()
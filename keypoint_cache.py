@@ -0,0 +1,110 @@
+import hashlib
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+
+class KeypointCache:
+    """
+    Disk cache of per-frame keypoint streams, keyed by video content.
+
+    An entry holds the (T, 17, 3) keypoints and (T,) timestamps (seconds)
+    the model produced for one video, so re-submitting the same file (for
+    another exercise, or after a threshold change) can replay the exercise
+    state machines without decoding or inference. Frames without a person
+    are stored as all-zero keypoints.
+
+    Keys combine the SHA-256 of the video bytes with the model identity
+    (backend, weights, input size, detection options) and the inference
+    stride, so a different model never reuses stale keypoints. The cache
+    is capped at max_bytes; the least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=512 * 1024 * 1024):
+        self.cache_dir = cache_dir or os.path.join(tempfile.gettempdir(), 'pose_keypoint_cache')
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evicted': 0}
+
+
+    @staticmethod
+    def video_hash(video_path, chunk_size=1024 * 1024):
+        """SHA-256 of the video file's bytes"""
+        digest = hashlib.sha256()
+        with open(video_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+
+    def key(self, video_path, model_identity, stride=1):
+        """Cache key for a video run through a model at an inference stride"""
+        identity = f"{self.video_hash(video_path)}|{model_identity}|stride={stride}"
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+
+    def get(self, key):
+        """(keypoints, timestamps) for a key, or None on a miss"""
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as entry:
+                keypoints, timestamps = entry['keypoints'], entry['timestamps']
+            # Reading counts as a use for LRU eviction
+            os.utime(path)
+        except (OSError, KeyError, ValueError):
+            self.stats['misses'] += 1
+            return None
+
+        self.stats['hits'] += 1
+        return keypoints, timestamps
+
+
+    def put(self, key, keypoints, timestamps):
+        """Store a keypoint stream, then evict old entries over the size cap"""
+        path = self._path(key)
+        # Write to a temp file and rename, so readers never see half an entry
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, keypoints=np.asarray(keypoints, dtype=np.float32),
+                         timestamps=np.asarray(timestamps, dtype=np.float64))
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self.evict()
+
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        with self._lock:
+            entries = []
+            for filename in os.listdir(self.cache_dir):
+                if not filename.endswith('.npz'):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.cache_dir, filename))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, filename))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, filename in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                except OSError:
+                    continue
+                total -= size
+                self.stats['evicted'] += 1
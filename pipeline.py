@@ -0,0 +1,266 @@
+import queue
+import threading
+
+import cv2
+
+
+# Marks the end of the stream in a queue
+_END = object()
+
+
+class _StageError:
+    """Carries an exception raised inside a stage thread to the consumer"""
+
+    def __init__(self, error):
+        self.error = error
+
+
+class FramePipeline:
+    """
+    Three-stage video pipeline: decode -> pose inference -> scoring/render.
+
+    The decoder and the inference stage each run on their own thread and are
+    connected by bounded queues, so cv2 decoding and model time overlap with
+    the caller's scoring, drawing and encoding. Iterating the pipeline yields
+    (frame, keypoints, timestamp) strictly in decode order.
+
+    timestamp is the frame's position in the video in seconds, from
+    CAP_PROP_POS_MSEC (correct for variable frame rate files), or
+    frame index / fps where the capture does not report it. It does not
+    depend on how fast the video is processed.
+
+    With stride=k only every k-th frame goes through the model. The frames in
+    between are skipped with cap.grab() (not decoded, yielded as None) unless
+    decode_skipped=True, and get keypoints linearly interpolated between the
+    neighbouring inferred frames, so the consumer still sees every frame.
+
+    Usage:
+        with FramePipeline(cap, calibrator, batch_size=8) as pipeline:
+            for frame, keypoints, timestamp in pipeline:
+                ...
+    """
+
+    def __init__(self, cap, calibrator, batch_size=8, queue_size=2, stride=1, decode_skipped=False):
+        self.cap = cap
+        self.calibrator = calibrator
+        self.batch_size = max(1, int(batch_size))
+        self.stride = max(1, int(stride))
+        self.decode_skipped = decode_skipped
+
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        self.frame_interval = 1.0 / fps if fps > 0 else 1.0 / 30
+        self._last_time = None
+
+        # Both queues hold whole batches; a full queue blocks the stage before it
+        self.frame_queue = queue.Queue(maxsize=queue_size)
+        self.result_queue = queue.Queue(maxsize=queue_size)
+
+        self._stop = threading.Event()
+        self._threads = []
+
+
+    def __enter__(self):
+        self.start()
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+    def __iter__(self):
+        while True:
+            item = self.result_queue.get()
+
+            if item is _END:
+                return
+            if isinstance(item, _StageError):
+                raise item.error
+
+            for frame, keypoints, timestamp in item:
+                yield frame, keypoints, timestamp
+
+
+    def start(self):
+        """Start the decoder and inference threads"""
+        if self._threads:
+            return
+
+        self._threads = [
+            threading.Thread(target=self._decode, name='pipeline-decode', daemon=True),
+            threading.Thread(target=self._infer, name='pipeline-infer', daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+
+    def close(self):
+        """Stop both stages and wait for them, so the capture can be released safely"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+
+    def _put(self, q, item):
+        """Blocking put that gives up once the pipeline is stopped"""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+    def _get(self, q):
+        """Blocking get that gives up once the pipeline is stopped"""
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+
+
+    def _frame_time(self):
+        """
+        Video time (seconds) of the frame just read or grabbed: the capture's
+        position, unless it is missing or does not advance, then one frame
+        interval after the previous frame.
+        """
+        position = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+        if self._last_time is None:
+            timestamp = max(0.0, position)
+        elif position > self._last_time:
+            timestamp = position
+        else:
+            timestamp = self._last_time + self.frame_interval
+
+        self._last_time = timestamp
+        return timestamp
+
+
+    def _skip_frames(self):
+        """
+        Advance past the stride - 1 frames after a keyframe; returns
+        ([(frame, timestamp), ...], ended)
+        """
+        skipped = []
+        for _ in range(self.stride - 1):
+            if self.decode_skipped:
+                ret, frame = self.cap.read()
+            else:
+                ret, frame = self.cap.grab(), None
+            if not ret:
+                return skipped, True
+            skipped.append((frame, self._frame_time()))
+        return skipped, False
+
+
+    def _read_batch(self):
+        """
+        Decode up to batch_size keyframes, each with the frames skipped after
+        it; returns ([(frame, timestamp, skipped), ...], ended)
+        """
+        items = []
+        while len(items) < self.batch_size:
+            ret, frame = self.cap.read()
+            if not ret:
+                return items, True
+            timestamp = self._frame_time()
+
+            skipped, ended = self._skip_frames()
+            items.append((frame, timestamp, skipped))
+            if ended:
+                return items, True
+        return items, False
+
+
+    def _decode(self):
+        """Stage 1: read frames from the capture"""
+        try:
+            while not self._stop.is_set():
+                items, ended = self._read_batch()
+
+                if items and not self._put(self.frame_queue, items):
+                    return
+
+                if ended:
+                    break
+        except Exception as e:
+            self._put(self.frame_queue, _StageError(e))
+            return
+
+        self._put(self.frame_queue, _END)
+
+
+    def _infer(self):
+        """Stage 2: run one model call per decoded batch"""
+        # A keyframe whose skipped frames wait for the next keyframe's keypoints
+        pending = None
+
+        while True:
+            item = self._get(self.frame_queue)
+
+            if item is None:
+                return
+            if item is _END or isinstance(item, _StageError):
+                if item is _END and pending is not None:
+                    if not self._put(self.result_queue, _fill_skipped(pending, None, None)):
+                        return
+                self._put(self.result_queue, item)
+                return
+
+            try:
+                batch_keypoints = self.calibrator.detect_pose_batch([frame for frame, _, _ in item])
+            except Exception as e:
+                self._put(self.result_queue, _StageError(e))
+                return
+
+            results = []
+            for (frame, timestamp, skipped), keypoints in zip(item, batch_keypoints):
+                if pending is not None:
+                    results.extend(_fill_skipped(pending, keypoints, timestamp))
+                    pending = None
+
+                if skipped:
+                    pending = (frame, keypoints, timestamp, skipped)
+                else:
+                    results.append((frame, keypoints, timestamp))
+
+            if results and not self._put(self.result_queue, results):
+                return
+
+
+def _fill_skipped(pending, next_keypoints, next_time):
+    """
+    Expand a keyframe and its skipped frames into (frame, keypoints,
+    timestamp) triples; skipped keypoints are interpolated by their time
+    between this keyframe and the next one.
+    """
+    frame, keypoints, timestamp, skipped = pending
+    results = [(frame, keypoints, timestamp)]
+
+    for i, (skipped_frame, skipped_time) in enumerate(skipped):
+        if next_time is not None and next_time > timestamp:
+            t = (skipped_time - timestamp) / (next_time - timestamp)
+        else:
+            t = (i + 1) / (len(skipped) + 1)
+        results.append((skipped_frame, interpolate_keypoints(keypoints, next_keypoints, t), skipped_time))
+
+    return results
+
+
+def interpolate_keypoints(start, end, t):
+    """
+    Linear interpolation between two (17, 3) keypoint arrays at t in [0, 1].
+    Holds start when end is missing (person lost or video ended).
+    """
+    if start is None:
+        return None
+    if end is None:
+        return start.copy()
+
+    return (start + (end - start) * t).astype(start.dtype)
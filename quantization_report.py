@@ -0,0 +1,228 @@
+"""
+Compare INT8 pose models against the float ONNX model on our exercise videos.
+
+For every exercise video, each model variant is run through the normal
+ExerciseEvaluator.process_video path and the report lists:
+  - inference latency per frame (model time only)
+  - keypoint error against the float model (pixels, joints with conf > 0.5)
+  - the rep / jump count (max reach for sitnreach) and its drift from float
+
+Usage:
+    python quantization_report.py --videos path/to/videos --output QUANTIZATION_REPORT.md
+
+Video files are matched to exercises by name prefix, e.g. pushup_01.mp4,
+squat.mp4, vjump-side.mp4. All videos found are also used to calibrate the
+static INT8 model.
+"""
+import argparse
+import contextlib
+import io
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+
+from app import ExerciseEvaluator
+from backends import create_backend
+
+
+EXERCISES = ['pushup', 'squat', 'situp', 'sitnreach', 'skipping', 'jumpingjacks', 'vjump', 'bjump']
+
+# What "the count" is for each exercise
+REP_COUNTS = {
+    'pushup': lambda ev: ev.counter,
+    'squat': lambda ev: ev.counter,
+    'situp': lambda ev: ev.counter,
+    'sitnreach': lambda ev: int(round(ev.metrics.max_reach_distance)),
+    'skipping': lambda ev: ev.metrics.jump_count,
+    'jumpingjacks': lambda ev: ev.metrics.jj_rep_count,
+    'vjump': lambda ev: ev.metrics.vjump_jump_count,
+    'bjump': lambda ev: ev.metrics.bjump_jump_count,
+}
+
+COUNT_LABELS = {'sitnreach': 'max reach (px)'}
+
+
+class RecordingBackend:
+    """Wraps a backend and records its keypoints and time spent in predict()"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.name = backend.name
+        self.imgsz = getattr(backend, 'imgsz', 640)
+        self.keypoints = []
+        self.seconds = 0.0
+
+
+    def predict(self, frames, **kwargs):
+        start = time.perf_counter()
+        keypoints = self.backend.predict(frames, **kwargs)
+        self.seconds += time.perf_counter() - start
+
+        self.keypoints.extend(keypoints)
+        return keypoints
+
+
+def find_videos(video_dir):
+    """Map each exercise to the first video in video_dir whose name starts with it"""
+    videos = {}
+    for filename in sorted(os.listdir(video_dir)):
+        if not filename.lower().endswith(('.mp4', '.avi', '.mov', '.mkv')):
+            continue
+        for exercise in EXERCISES:
+            if filename.lower().startswith(exercise) and exercise not in videos:
+                videos[exercise] = os.path.join(video_dir, filename)
+    return videos
+
+
+def run_variant(backend, video_path, exercise_type, batch_size):
+    """Run one exercise video through the evaluator; returns (recorder, count)"""
+    recorder = RecordingBackend(backend)
+    evaluator = ExerciseEvaluator(batch_size=batch_size, backend=recorder)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        evaluator.process_video(video_path, exercise_type)
+
+    return recorder, REP_COUNTS[exercise_type](evaluator)
+
+
+def keypoint_error(reference, candidate, min_conf=0.5):
+    """
+    Mean / 95th percentile pixel distance over joints the reference sees with
+    conf > min_conf, plus the share of frames where detection agreed.
+    """
+    distances = []
+    agree = 0
+
+    for ref, cand in zip(reference, candidate):
+        if (ref is None) == (cand is None):
+            agree += 1
+        if ref is None or cand is None:
+            continue
+
+        visible = ref[:, 2] > min_conf
+        if np.any(visible):
+            distances.append(np.linalg.norm(ref[visible, :2] - cand[visible, :2], axis=1))
+
+    agreement = 100.0 * agree / len(reference) if reference else 0.0
+    if not distances:
+        return None, None, agreement
+
+    distances = np.concatenate(distances)
+    return float(np.mean(distances)), float(np.percentile(distances, 95)), agreement
+
+
+def build_report(rows, variants, videos):
+    """Render the collected rows as a markdown report"""
+    lines = [
+        "# INT8 Quantization Report",
+        "",
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "",
+        "Reference is the float ONNX model. Latency is model time per frame on CPU.",
+        "Keypoint error is the pixel distance to the float keypoints for joints the",
+        "float model sees with conf > 0.5.",
+        "",
+        "## Videos",
+        "",
+    ]
+    for exercise in EXERCISES:
+        lines.append(f"- {exercise}: {videos.get(exercise, 'not found')}")
+
+    lines += ["", "## Results", "",
+              "| exercise | model | ms/frame | speedup | kp error mean (px) | kp error p95 (px) "
+              "| detection agreement | count | drift |",
+              "|---|---|---|---|---|---|---|---|---|"]
+
+    for row in rows:
+        mean = f"{row['kp_mean']:.2f}" if row['kp_mean'] is not None else "-"
+        p95 = f"{row['kp_p95']:.2f}" if row['kp_p95'] is not None else "-"
+        lines.append(
+            f"| {row['exercise']} | {row['variant']} | {row['ms_per_frame']:.1f} "
+            f"| {row['speedup']:.2f}x | {mean} | {p95} | {row['agreement']:.1f}% "
+            f"| {row['count']} | {row['drift']:+d} |")
+
+    lines += ["", "## Summary", ""]
+    for variant in variants[1:]:
+        variant_rows = [row for row in rows if row['variant'] == variant]
+        if not variant_rows:
+            continue
+        speedup = np.mean([row['speedup'] for row in variant_rows])
+        drifted = [row['exercise'] for row in variant_rows
+                   if row['drift'] != 0 and row['exercise'] != 'sitnreach']
+        lines.append(f"- {variant}: {speedup:.2f}x mean speedup; count drift in: "
+                     f"{', '.join(drifted) if drifted else 'none'}")
+
+    lines += ["", "Count column is reps (jumps for skipping/vjump/bjump); "
+              f"for sitnreach it is {COUNT_LABELS['sitnreach']}.", ""]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="INT8 vs float pose model report")
+    parser.add_argument('--videos', required=True, help="Directory with one video per exercise")
+    parser.add_argument('--model', default='yolov8n-pose.pt')
+    parser.add_argument('--imgsz', type=int, default=640)
+    parser.add_argument('--batch-size', type=int, default=8)
+    parser.add_argument('--output', default='QUANTIZATION_REPORT.md')
+    args = parser.parse_args()
+
+    videos = find_videos(args.videos)
+    if not videos:
+        raise SystemExit(f"No exercise videos found in {args.videos}")
+
+    missing = [exercise for exercise in EXERCISES if exercise not in videos]
+    if missing:
+        print(f"⚠ No video for: {', '.join(missing)}")
+
+    backends = {
+        'float': create_backend('onnx', model_path=args.model, imgsz=args.imgsz),
+        'int8-dynamic': create_backend('onnx-int8', model_path=args.model, imgsz=args.imgsz,
+                                       quantize='dynamic'),
+        'int8-static': create_backend('onnx-int8', model_path=args.model, imgsz=args.imgsz,
+                                      quantize='static',
+                                      calibration_videos=list(videos.values())),
+    }
+    variants = list(backends)
+
+    rows = []
+    for exercise in EXERCISES:
+        if exercise not in videos:
+            continue
+
+        print(f"Running {exercise} ({videos[exercise]})...")
+        reference = None
+        for variant in variants:
+            recorder, count = run_variant(backends[variant], videos[exercise], exercise, args.batch_size)
+            frames = max(1, len(recorder.keypoints))
+
+            if reference is None:
+                reference = (recorder, count)
+
+            kp_mean, kp_p95, agreement = keypoint_error(reference[0].keypoints, recorder.keypoints)
+            ms_per_frame = 1000.0 * recorder.seconds / frames
+            reference_ms = 1000.0 * reference[0].seconds / max(1, len(reference[0].keypoints))
+
+            rows.append({
+                'exercise': exercise,
+                'variant': variant,
+                'ms_per_frame': ms_per_frame,
+                'speedup': reference_ms / ms_per_frame if ms_per_frame > 0 else 0.0,
+                'kp_mean': kp_mean,
+                'kp_p95': kp_p95,
+                'agreement': agreement,
+                'count': count,
+                'drift': count - reference[1],
+            })
+
+    report = build_report(rows, variants, videos)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(report)
+
+    print(report)
+    print(f"✓ Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import Future
+
+import cv2
+
+
+# What scoring hands the renderer for one frame: the frame index in the
+# source video, its keypoints (None: no person) and angles, and snapshots
+# of the calibration state and the dashboard taken when it was scored.
+RenderRecord = namedtuple('RenderRecord', 'index keypoints angles calibration dashboard')
+
+# End-of-stream markers on the record queue
+_FINISH = object()
+_CANCEL = object()
+
+
+class FFmpegWriter:
+    """
+    cv2.VideoWriter look-alike that pipes raw BGR frames into an ffmpeg
+    process encoding H.264 (libx264) into an MP4. Encoding (and any
+    rescaling) runs in that process, off the renderer thread.
+
+    crf and preset trade size for quality and encoding speed as in libx264
+    (lower crf: better quality, bigger file). height scales the output,
+    keeping the aspect ratio; dimensions are rounded to even numbers, as
+    yuv420p requires.
+    """
+
+    def __init__(self, output_path, fps, size, crf=23, preset='veryfast', height=None, ffmpeg='ffmpeg'):
+        width, source_height = size
+        if height:
+            scale = f"scale=-2:{int(height) // 2 * 2}"
+        else:
+            scale = "scale=trunc(iw/2)*2:trunc(ih/2)*2"
+
+        command = [ffmpeg, '-y', '-loglevel', 'error',
+                   '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-s', f"{width}x{source_height}",
+                   '-r', str(fps), '-i', '-',
+                   '-vf', scale, '-c:v', 'libx264', '-preset', preset, '-crf', str(crf),
+                   '-pix_fmt', 'yuv420p', '-movflags', '+faststart', output_path]
+
+        # A file, not a pipe: nobody reads stderr until the encoder exits
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE,
+                                         stdout=subprocess.DEVNULL, stderr=self._stderr)
+
+
+    def write(self, frame):
+        try:
+            self._process.stdin.write(frame.tobytes())
+        except BrokenPipeError:
+            raise IOError(f"ffmpeg exited early: {self._error_output()}")
+
+
+    def release(self):
+        """Flush and wait for the encoder; raises if ffmpeg failed"""
+        if self._process.stdin.closed:
+            return
+        try:
+            self._process.stdin.close()
+        except BrokenPipeError:
+            pass
+        if self._process.wait() != 0:
+            raise IOError(f"ffmpeg failed: {self._error_output()}")
+
+
+    def _error_output(self):
+        self._process.wait()
+        self._stderr.seek(0)
+        return self._stderr.read().decode('utf-8', 'replace').strip()
+
+
+class MJPGWriter:
+    """Motion-JPEG AVI through OpenCV, optionally scaled to an output height"""
+
+    def __init__(self, output_path, fps, size, height=None):
+        self.size = size
+        if height:
+            self.size = (int(round(size[0] * height / size[1])), int(height))
+        self._writer = cv2.VideoWriter(output_path, cv2.VideoWriter_fourcc(*'MJPG'), fps, self.size)
+
+
+    def write(self, frame):
+        if (frame.shape[1], frame.shape[0]) != self.size:
+            frame = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+        self._writer.write(frame)
+
+
+    def release(self):
+        self._writer.release()
+
+
+def open_video_writer(output_path, fps, size, codec='h264', crf=23, preset='veryfast', height=None,
+                      ffmpeg='ffmpeg'):
+    """
+    Writer for an output video: 'h264' (MP4 through ffmpeg / libx264) or
+    'mjpg' (AVI through OpenCV, much bigger files). h264 falls back to MJPG
+    when no ffmpeg executable is found.
+    Returns (writer, path); path gets the extension of the container used.
+    """
+    if codec not in ('h264', 'mjpg'):
+        raise ValueError(f"Unknown output codec: {codec}")
+
+    base = os.path.splitext(output_path)[0]
+    if codec == 'h264':
+        if shutil.which(ffmpeg):
+            path = base + '.mp4'
+            return FFmpegWriter(path, fps, size, crf, preset, height, ffmpeg), path
+        print(f"⚠ {ffmpeg} not found, writing MJPG output instead of H.264")
+
+    path = base + '.avi'
+    return MJPGWriter(path, fps, size, height), path
+
+
+class DeferredRenderer:
+    """
+    Draws and encodes the annotated output video on its own thread.
+
+    Scoring hands over one small RenderRecord per frame with add() and never
+    waits on drawing or encoding. The renderer decodes the source video
+    again itself, so no frames are kept in memory or passed between
+    threads, draws each record onto its frame with draw(frame, record) and
+    writes the result. The video is complete when wait() returns or the
+    done callbacks run.
+
+    writer_options go to open_video_writer (codec, crf, preset, height,
+    ffmpeg). output_path's extension follows the container actually
+    written (.mp4 or .avi); wait() returns the final path, or None when no
+    frame was written.
+
+    mark_still(index) picks the frame just added as a still image (e.g. the
+    sit-and-reach maximum); the last one marked is drawn and saved as a JPEG
+    at still_path once the video is done.
+    """
+
+    # Further ahead than this, seek instead of decoding the frames in between
+    SEEK_GAP = 60
+
+    def __init__(self, video_path, output_path, draw, **writer_options):
+        self.video_path = video_path
+        self.output_path = output_path
+        self.draw = draw
+        self.writer_options = writer_options
+        self.frames_written = 0
+        self.events = []
+        self.still_path = None
+
+        # Unbounded: records are a few hundred bytes, and scoring must not block
+        self._records = queue.Queue()
+        self._last = None
+        self._still = None
+        self._future = Future()
+        self._thread = threading.Thread(target=self._run, name='deferred-render', daemon=True)
+
+
+    def start(self):
+        self._thread.start()
+        return self
+
+
+    def add(self, index, keypoints, angles, calibration, dashboard):
+        """Hand over one scored frame; records must arrive in frame order"""
+        self._last = RenderRecord(index, keypoints, angles, calibration, dashboard)
+        self._submit(self._last)
+
+
+    def _submit(self, record):
+        self._records.put(record)
+
+
+    def mark_event(self, index):
+        """A highlight (completed rep or jump) on the frame just added"""
+        self.events.append(index)
+
+
+    def mark_still(self, index):
+        """Use the frame just added as the still image"""
+        self._still = self._last
+
+
+    def finish(self):
+        """No more records: render what is queued and close the video"""
+        self._records.put(_FINISH)
+
+
+    def cancel(self):
+        """Scoring failed: stop rendering and fail the output"""
+        self._records.put(_CANCEL)
+
+
+    def done(self):
+        return self._future.done()
+
+
+    def wait(self, timeout=None):
+        """Block until the video is written; returns its path or raises the render error"""
+        return self._future.result(timeout)
+
+
+    def add_done_callback(self, fn):
+        """Call fn(renderer) once rendering ends (at once if it already has)"""
+        self._future.add_done_callback(lambda future: fn(self))
+
+
+    def _run(self):
+        cap = cv2.VideoCapture(self.video_path)
+        writer = None
+        error = None
+        try:
+            if not cap.isOpened():
+                raise IOError(f"Could not open video file {self.video_path}")
+
+            fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+            size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+
+            frame = None
+            frame_index = -1
+            while True:
+                record = self._records.get()
+                if record is _FINISH:
+                    break
+                if record is _CANCEL:
+                    raise RuntimeError("Rendering cancelled")
+
+                # Decode up to the record's frame (seek over long gaps)
+                if record.index - frame_index > self.SEEK_GAP:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, record.index)
+                    frame_index = record.index - 1
+                while frame_index < record.index:
+                    ret, frame = cap.read()
+                    if not ret:
+                        frame = None
+                        break
+                    frame_index += 1
+
+                # Source ended early: nothing left to draw on
+                if frame is None or frame_index != record.index:
+                    continue
+
+                if writer is None:
+                    writer, self.output_path = open_video_writer(self.output_path, fps, size,
+                                                                 **self.writer_options)
+                writer.write(self.draw(frame, record))
+                self.frames_written += 1
+
+            if writer is None:
+                self.output_path = None
+            else:
+                # Flushes the encoder: its errors fail the render
+                writer.release()
+
+            if self._still is not None:
+                self._save_still(cap, self._still)
+        except Exception as e:
+            error = e
+            if writer:
+                try:
+                    writer.release()
+                except Exception:
+                    pass    # already failing; e is the error reported
+        finally:
+            cap.release()
+
+        # Only now: waiters may exit the process, which must not catch this
+        # thread inside OpenCV
+        if error is None:
+            self._future.set_result(self.output_path)
+        else:
+            self._future.set_exception(error)
+
+
+    def _save_still(self, cap, record):
+        cap.set(cv2.CAP_PROP_POS_FRAMES, record.index)
+        ret, frame = cap.read()
+        if not ret:
+            return
+
+        path = os.path.splitext(self.output_path or self.video_path)[0] + '_still.jpg'
+        if not cv2.imwrite(path, self.draw(frame, record)):
+            raise IOError(f"Could not write still image {path}")
+        self.still_path = path
+
+
+class HighlightRenderer(DeferredRenderer):
+    """
+    A DeferredRenderer that renders only short windows around the events
+    marked with mark_event (completed reps and jumps) into a highlight
+    reel: `before` frames leading up to each event and `after` frames
+    following it, overlapping windows merged. Records outside every window
+    are dropped and the frames between windows are seeked over, so the
+    rendering cost grows with the number of events, not the video length.
+    """
+
+    def __init__(self, video_path, output_path, draw, before=60, after=30, **writer_options):
+        super().__init__(video_path, output_path, draw, **writer_options)
+        self.before = max(0, int(before))
+        self.after = max(0, int(after))
+
+        # Records not rendered yet, in case an event comes within `before` frames
+        self._recent = deque(maxlen=self.before + 1)
+        # Last frame of the current window
+        self._until = -1
+
+
+    def _submit(self, record):
+        if record.index <= self._until:
+            self._records.put(record)
+        else:
+            self._recent.append(record)
+
+
+    def mark_event(self, index):
+        super().mark_event(index)
+        # Open the window: the buffered frames up to the event, then `after` more
+        while self._recent:
+            self._records.put(self._recent.popleft())
+        self._until = max(self._until, index + self.after)
@@ -5,12 +5,17 @@ import argparse
 import time
 # Assuming PoseCalibrator exists in utils.py as per original context
 from utils import PoseCalibrator 
-from metrics import PerformanceMetrics
+from angles import reads_features
+from metrics import create_metrics
+from pipeline import FramePipeline
+from renderer import open_video_writer
 
 class ExerciseEvaluator:
-    def __init__(self):
-        self.calibrator = PoseCalibrator(model_path='yolov8n-pose.pt')
-        self.metrics = PerformanceMetrics()
+    def __init__(self, imgsz=None, tracking=False, motion_gate=False):
+        self.calibrator = PoseCalibrator(model_path='yolov8n-pose.pt', imgsz=imgsz, tracking=tracking,
+                                         motion_gate=motion_gate)
+        # Built for the exercise by run
+        self.metrics = None
         
         # Exercise State Variables
         self.current_exercise = None
@@ -167,7 +172,8 @@ class ExerciseEvaluator:
         
         return frame
 
-    def process_pushup(self, angles, keypoints):
+    @reads_features('left_elbow', 'right_elbow', 'left_hip', 'right_hip')
+    def process_pushup(self, angles, keypoints, current_time=None):
         """Logic for Pushups"""
         # Validate keypoints array
         if keypoints is None or len(keypoints) < 17:
@@ -218,7 +224,8 @@ class ExerciseEvaluator:
             
             print(f"Pushup Count: {self.counter}")
 
-    def process_squat(self, angles, keypoints):
+    @reads_features('left_knee', 'right_knee', 'torso_angle', 'shin_angle_left', 'shin_angle_right')
+    def process_squat(self, angles, keypoints, current_time=None):
         """Logic for Squats with comprehensive biomechanical tracking"""
         # Validate keypoints array
         if keypoints is None or len(keypoints) < 17:
@@ -237,8 +244,9 @@ class ExerciseEvaluator:
             self.feedback = "Legs not visible"
             return
         
-        # Get current time for velocity and tempo calculations
-        current_time = time.time()
+        # Frame time (video clock) for velocity and tempo calculations
+        if current_time is None:
+            current_time = time.time()
         
         # Extract additional angles (calculated by utils.py)
         torso_angle = angles.get('torso_angle')
@@ -338,14 +346,16 @@ class ExerciseEvaluator:
             if self.stage != "DOWN":
                 self.feedback = "Squat"
 
-    def process_situp(self, angles, keypoints):
+    @reads_features('torso_inclination_horizontal', 'hip_flexion_angle')
+    def process_situp(self, angles, keypoints, current_time=None):
         """Logic for Sit-ups with comprehensive biomechanical tracking"""
         # Validate keypoints array
         if keypoints is None or len(keypoints) < 17:
             self.feedback = "Body not detected"
             return
         
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         
         # Extract situp-specific angles
         torso_inclination = angles.get('torso_inclination_horizontal')
@@ -471,10 +481,13 @@ class ExerciseEvaluator:
                 self.metrics.situp_state = 'descending'
                 self.feedback = "Controlled Down"
 
-    def process_sitnreach(self, angles, keypoints):
+    @reads_features('reach_distance', 'arm_length', 'sitnreach_hip_angle',
+                    'sitnreach_back_angle', 'sitnreach_knee_angle', 'reach_symmetry')
+    def process_sitnreach(self, angles, keypoints, current_time=None):
         """Logic for Sit-and-Reach with comprehensive flexibility tracking"""
         import time
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         
         # Initialize start time
         if self.metrics.sitnreach_start_time is None:
@@ -517,7 +530,7 @@ class ExerciseEvaluator:
             feedback_parts.append("Straighten Legs!")
         
         # Check symmetry
-        if symmetry_error and symmetry_error > 50:
+        if symmetry_error and symmetry_error > self.metrics._px('sitnreach_max_symmetry_error'):
             feedback_parts.append("Balance Both Sides")
         
         # Check hip flexibility
@@ -532,13 +545,16 @@ class ExerciseEvaluator:
         self.feedback = " | ".join(feedback_parts)
         
         # Update counter with max reach (in cm for display)
-    def process_skipping(self, angles, keypoints):
+
+    @reads_features('skip_back_angle', 'skip_knee_angle')
+    def process_skipping(self, angles, keypoints, current_time=None):
         """Logic for Skipping (Jump Rope) with comprehensive biomechanical tracking"""
         # Validate keypoints array
         if keypoints is None or len(keypoints) < 17:
             self.feedback = "Body not detected"
             return
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         
         # Initialize start time
         if self.metrics.skip_start_time is None:
@@ -577,13 +593,15 @@ class ExerciseEvaluator:
         
         self.feedback = " | ".join(feedback_parts)
 
-    def process_jumpingjacks(self, angles, keypoints):
+    @reads_features('jj_arm_angle', 'jj_back_angle')
+    def process_jumpingjacks(self, angles, keypoints, current_time=None):
         """Logic for Jumping Jacks with comprehensive biomechanical tracking"""
         # Validate keypoints array
         if keypoints is None or len(keypoints) < 17:
             self.feedback = "Body not detected"
             return
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         
         # Initialize start time
         if self.metrics.jj_start_time is None:
@@ -606,8 +624,12 @@ class ExerciseEvaluator:
         
         # Show detection status for each component
         arm_status = "✓" if arm_angle >= 135 else ("✗" if arm_angle <= 45 else "~")
-        leg_status = "✓" if leg_spread >= 120 else ("✗" if leg_spread <= 100 else "~")
-        spread_status = "✓" if arm_spread >= 180 else ("✗" if arm_spread <= 120 else "~")
+        leg_open = self.metrics._px('jj_leg_open_threshold')
+        leg_closed = self.metrics._px('jj_leg_close_threshold')
+        arm_open = self.metrics._px('jj_arm_open_threshold')
+        arm_closed = self.metrics._px('jj_arm_close_threshold')
+        leg_status = "✓" if leg_spread >= leg_open else ("✗" if leg_spread <= leg_closed else "~")
+        spread_status = "✓" if arm_spread >= arm_open else ("✗" if arm_spread <= arm_closed else "~")
         
         # Show measurements with status indicators
         feedback_parts.append(f"Angle:{int(arm_angle)}°{arm_status}")
@@ -621,18 +643,21 @@ class ExerciseEvaluator:
         else:  # closed
             if arm_angle > 60:
                 feedback_parts.append("↓ LOWER ARMS!")
-            if leg_spread > 120:
+            if leg_spread > leg_open:
                 feedback_parts.append("→← FEET TOGETHER!")
         
         self.feedback = " | ".join(feedback_parts)
 
-    def process_vjump(self, angles, keypoints):
+    @reads_features('vjump_countermovement_angle', 'vjump_arm_swing_angle',
+                    'vjump_landing_knee_angle')
+    def process_vjump(self, angles, keypoints, current_time=None):
         """Logic for Vertical Jump with comprehensive biomechanical tracking"""
         # Validate keypoints array
         if keypoints is None or len(keypoints) < 17:
             self.feedback = "Body not detected"
             return
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         
         # Initialize start time
         if self.metrics.vjump_start_time is None:
@@ -680,13 +705,15 @@ class ExerciseEvaluator:
         
         self.feedback = " | ".join(feedback_parts)
 
-    def process_bjump(self, angles, keypoints):
+    @reads_features('bjump_countermovement_angle', 'bjump_arm_swing_angle')
+    def process_bjump(self, angles, keypoints, current_time=None):
         """Logic for Broad Jump with comprehensive biomechanical tracking"""
         # Validate keypoints array
         if keypoints is None or len(keypoints) < 17:
             self.feedback = "Body not detected"
             return
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         
         # Initialize start time
         if self.metrics.bjump_start_time is None:
@@ -719,6 +746,11 @@ class ExerciseEvaluator:
         
         self.feedback = " | ".join(feedback_parts)
 
+    def exercise_features(self, exercise_type):
+        """Angle features the exercise's handler declares with @reads_features (None = all)"""
+        handler = getattr(self, f'process_{exercise_type}', None)
+        return getattr(handler, 'features', None)
+
     def _resize_for_display(self, frame, max_width=1280, max_height=720):
         h, w = frame.shape[:2]
         if w == 0 or h == 0: return frame
@@ -727,7 +759,7 @@ class ExerciseEvaluator:
         new_h = int(h * scale)
         return cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
 
-    def run(self, exercise_type='pushup', source='0', save_output=True):
+    def run(self, exercise_type='pushup', source='0', save_output=True, batch_size=1, flow_interval=1):
         if source == '0' or source == 0:
             cap = cv2.VideoCapture(0)
             input_is_camera = True
@@ -749,60 +781,78 @@ class ExerciseEvaluator:
             
             import os
             filename, ext = os.path.splitext(source)
-            output_path = f"{filename}_processed.avi"
-            
-            fourcc = cv2.VideoWriter_fourcc(*'MJPG')
-            writer = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+            # H.264 MP4 when ffmpeg is installed, MJPG AVI otherwise
+            writer, output_path = open_video_writer(f"{filename}_processed.mp4", fps or 30.0, (width, height))
             print(f"Saving output to: {output_path}")
 
         self.current_exercise = exercise_type
-        self.metrics.exercise = exercise_type
+        # Fresh state for every session, holding only this exercise's metrics
+        self.metrics = create_metrics(exercise_type)
+        self.counter = 0
+        self.stage = None
+        self.feedback = "Setup"
         self.start_time = time.time()
+        self.calibrator.reset_tracking()
+        self.calibrator.set_features(self.exercise_features(exercise_type))
+        # Model every flow_interval frames, optical flow in between
+        self.calibrator.flow_interval = max(1, int(flow_interval))
         print(f"\nStarting {exercise_type.upper()} analysis on {source}...")
         print("Press 'Q' to quit\n")
         
         cv2.namedWindow('AI Trainer', cv2.WINDOW_NORMAL)
         
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret: break
-            
-            frame, keypoints, angles = self.calibrator.process_frame(frame, show_angles_panel=False)
-            
-            if keypoints is not None:
-                if exercise_type == 'pushup':
-                    self.process_pushup(angles, keypoints)
-                elif exercise_type == 'squat':
-                    self.process_squat(angles, keypoints)
-                elif exercise_type == 'situp':
-                    self.process_situp(angles, keypoints)
-                elif exercise_type == 'sitnreach':
-                    self.process_sitnreach(angles, keypoints)
-                elif exercise_type == 'skipping':
-                    self.process_skipping(angles, keypoints)
-                elif exercise_type == 'jumpingjacks':
-                    self.process_jumpingjacks(angles, keypoints)
-                elif exercise_type == 'vjump':
-                    self.process_vjump(angles, keypoints)
-                elif exercise_type == 'bjump':
-                    self.process_bjump(angles, keypoints)
-            
-            frame = self._draw_dashboard(frame, exercise_type)
-            display_frame = self._resize_for_display(frame)
-            cv2.resizeWindow('AI Trainer', display_frame.shape[1], display_frame.shape[0])
-            cv2.imshow('AI Trainer', display_frame)
-            
-            if writer: writer.write(frame)
-            if cv2.waitKey(1) & 0xFF == ord('q'): break
-                
-        cap.release()
-        if writer: writer.release()
-        cv2.destroyAllWindows()
+        # Decoding and inference run on pipeline threads; scoring and the
+        # display stay on the main thread (cv2.imshow requires it)
+        try:
+            with FramePipeline(cap, self.calibrator, batch_size=batch_size) as pipeline:
+                for frame, keypoints, timestamp in pipeline:
+                    # Video files run on their own clock; the webcam on the wall clock
+                    current_time = None if input_is_camera else timestamp
+                    
+                    frame, keypoints, angles = self.calibrator.process_keypoints(frame, keypoints, current_time)
+                    
+                    if keypoints is not None:
+                        # Pixel thresholds scale with the athlete's measured torso length
+                        self.metrics.body_scale = self.calibrator.body_scale
+                        self.metrics.current_time = current_time
+                        
+                        if exercise_type == 'pushup':
+                            self.process_pushup(angles, keypoints, current_time)
+                        elif exercise_type == 'squat':
+                            self.process_squat(angles, keypoints, current_time)
+                        elif exercise_type == 'situp':
+                            self.process_situp(angles, keypoints, current_time)
+                        elif exercise_type == 'sitnreach':
+                            self.process_sitnreach(angles, keypoints, current_time)
+                        elif exercise_type == 'skipping':
+                            self.process_skipping(angles, keypoints, current_time)
+                        elif exercise_type == 'jumpingjacks':
+                            self.process_jumpingjacks(angles, keypoints, current_time)
+                        elif exercise_type == 'vjump':
+                            self.process_vjump(angles, keypoints, current_time)
+                        elif exercise_type == 'bjump':
+                            self.process_bjump(angles, keypoints, current_time)
+                    
+                    frame = self._draw_dashboard(frame, exercise_type)
+                    display_frame = self._resize_for_display(frame)
+                    cv2.resizeWindow('AI Trainer', display_frame.shape[1], display_frame.shape[0])
+                    cv2.imshow('AI Trainer', display_frame)
+                    
+                    if writer: writer.write(frame)
+                    if cv2.waitKey(1) & 0xFF == ord('q'): break
+        finally:
+            cap.release()
+            if writer: writer.release()
+            cv2.destroyAllWindows()
         
         print("\n" + "="*50)
         print("Analysis Complete!")
         print("="*50)
         
+        if self.calibrator.flow_interval > 1:
+            stats = self.calibrator.flow_stats
+            print(f"Optical flow: {stats['flow']} propagated frames, {stats['model']} model frames")
+        
         # ---------------------------------------------------------
         # CALLING SPECIFIC METRICS FUNCTIONS AND SAVING RESULTS
         # ---------------------------------------------------------
@@ -881,6 +931,13 @@ def get_source():
             else: print("Invalid path!")
         else: print("Invalid choice! Please enter 1 or 2")
 
+def get_flow_interval():
+    while True:
+        choice = input("Run pose model every N frames, optical flow in between (Enter for 1 = every frame): ").strip()
+        if not choice: return 1
+        elif choice.isdigit() and int(choice) >= 1: return int(choice)
+        else: print("Invalid number!")
+
 def get_save_option():
     while True:
         choice = input("Save output video? (y/n): ").strip().lower()
@@ -891,11 +948,13 @@ def get_save_option():
 if __name__ == "__main__":
     exercise_type = get_exercise_type()
     source = get_source()
+    flow_interval = get_flow_interval()
     save_output = get_save_option()
     
     trainer = ExerciseEvaluator()
     trainer.run(
         exercise_type=exercise_type,
         source=source,
-        save_output=save_output
+        save_output=save_output,
+        flow_interval=flow_interval
     )
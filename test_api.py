@@ -3,6 +3,7 @@ Test script for FastAPI Exercise Trainer
 """
 import requests
 import json
+import time
 
 # Base URL
 BASE_URL = "http://localhost:8000"
@@ -45,40 +46,62 @@ def test_analyze(video_path, exercise_type, save_output=False):
         print(f"Uploading video: {video_path}")
         print(f"Exercise type: {exercise_type}")
         print(f"Save output: {save_output}")
-        print("\nProcessing... (this may take a moment)")
         
         response = requests.post(f"{BASE_URL}/analyze", files=files, data=data)
+    
+    print(f"\nStatus Code: {response.status_code}")
+    if response.status_code != 202:
+        print(f"Error: {response.text}")
+        return
+    
+    job_id = response.json()['job_id']
+    print(f"Job ID: {job_id}")
+    print("\nProcessing... (this may take a moment)")
+    
+    # Poll the job until the analysis has finished
+    while True:
+        response = requests.get(f"{BASE_URL}/jobs/{job_id}")
+        result = response.json()
+        if response.status_code != 200 or result['status'] in ('done', 'failed'):
+            break
         
-        print(f"\nStatus Code: {response.status_code}")
-        
-        if response.status_code == 200:
-            result = response.json()
-            
-            # Print logs (simulating terminal output)
-            if 'metrics' in result and 'logs' in result['metrics']:
-                print("\n" + "="*60)
-                print("EXERCISE ANALYSIS LOGS (Terminal Output)")
-                print("="*60)
-                for log in result['metrics']['logs']:
-                    print(log)
-            
-            # Print summary
+        if result['progress'] is not None:
+            print(f"  {result['frames_done']}/{result['total_frames']} frames ({result['progress']:.0%})")
+        time.sleep(1)
+    
+    # The metrics come first; an output video may still be rendering
+    while response.status_code == 200 and result.get('output_video_status') == 'rendering':
+        print("  Rendering output video...")
+        time.sleep(1)
+        response = requests.get(f"{BASE_URL}/jobs/{job_id}")
+        result = response.json()
+    
+    if result.get('status') == 'done':
+        # Print logs (simulating terminal output)
+        if 'metrics' in result and 'logs' in result['metrics']:
             print("\n" + "="*60)
-            print("API RESPONSE SUMMARY")
+            print("EXERCISE ANALYSIS LOGS (Terminal Output)")
             print("="*60)
-            print(f"Success: {result.get('success')}")
-            print(f"Exercise: {result.get('exercise')}")
-            print(f"Output video available: {result.get('output_video_available')}")
-            
-            if 'metrics' in result:
-                metrics = result['metrics']
-                # Remove logs from display to keep it clean
-                if 'logs' in metrics:
-                    del metrics['logs']
-                print(f"\nMetrics Summary:")
-                print(json.dumps(metrics, indent=2))
-        else:
-            print(f"Error: {response.text}")
+            for log in result['metrics']['logs']:
+                print(log)
+        
+        # Print summary
+        print("\n" + "="*60)
+        print("API RESPONSE SUMMARY")
+        print("="*60)
+        print(f"Status: {result.get('status')}")
+        print(f"Exercise: {result.get('exercise')}")
+        print(f"Output video available: {result.get('output_video_available')}")
+        
+        if 'metrics' in result:
+            metrics = result['metrics']
+            # Remove logs from display to keep it clean
+            if 'logs' in metrics:
+                del metrics['logs']
+            print(f"\nMetrics Summary:")
+            print(json.dumps(metrics, indent=2))
+    else:
+        print(f"Error: {result.get('error', response.text)}")
 
 
 def main():
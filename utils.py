@@ -2,23 +2,83 @@
 import cv2
 import numpy as np
 import math
-from ultralytics import YOLO
 import time
+from collections import deque
+
+from angles import DISTANCE_FEATURES, FEATURES, JOINT_ANGLES, compute_angles, frame_value
+from backends import backend_identity, create_backend
 
 
 class PoseCalibrator:
     """
     A comprehensive pose calibration system for exercise tracking.
     Supports YOLOv8 pose estimation with 17 keypoints.
+    
+    The inference backend is pluggable: pass backend='torch' (ultralytics /
+    PyTorch, the default), backend='onnx' (onnxruntime on CPU), or an
+    already-built backend object from backends.py.
+    
+    imgsz sets the model input size (e.g. 320 for speed); keypoints are always
+    returned in source-frame pixels. body_scale is the athlete's torso length
+    in pixels, measured while calibrating, so pixel thresholds can be scaled.
+    
+    tracking=True runs the model on a crop around the athlete's last box (plus
+    track_margin) instead of the whole frame, and falls back to a full-frame
+    pass when the crop result is weak or the person reaches the crop edge.
+    
+    motion_gate=True skips the model on frames where the athlete's region has
+    not changed (downsampled frame difference below gate_threshold grey
+    levels) and reuses the previous keypoints, for at most gate_max_reuse
+    frames in a row.
+    
+    flow_interval=N runs the model on every N-th frame only and moves the
+    keypoints along with sparse optical flow (Lucas-Kanade) on the frames in
+    between. Each propagated step multiplies confidence by flow_decay and by
+    exp(-moved_pixels / flow_decay_distance); points the flow loses get 0.
     """
     
-    def __init__(self, model_path='yolov8n-pose.pt', calibration_time=20):
-        self.model = YOLO(model_path)
+    def __init__(self, model_path='yolov8n-pose.pt', calibration_time=20, backend='torch', imgsz=None,
+                 tracking=False, track_margin=0.25, track_min_confidence=0.4,
+                 motion_gate=False, gate_threshold=2.0, gate_max_reuse=10, gate_downsample=8,
+                 flow_interval=1, flow_decay=0.9, flow_decay_distance=50.0):
+        if isinstance(backend, str):
+            backend_options = {'imgsz': imgsz} if imgsz else {}
+            backend = create_backend(backend, model_path=model_path, **backend_options)
+        self.backend = backend
         self.calibrated = False
         self.calibration_start_time = None
         self.calibration_time = calibration_time
         self.calibration_elapsed = 0
         
+        # Torso lengths (shoulder mid to hip mid, pixels) seen during calibration
+        self.torso_lengths = deque(maxlen=300)
+        
+        # Person tracking (ROI crops)
+        self.tracking = tracking
+        self.track_margin = track_margin
+        self.track_min_confidence = track_min_confidence
+        self.track_box = None
+        self.tracking_stats = {'roi': 0, 'fallback': 0, 'full': 0}
+        
+        # Motion gate: reference thumbnail/keypoints of the last inferred frame
+        self.motion_gate = motion_gate
+        self.gate_threshold = gate_threshold
+        self.gate_max_reuse = gate_max_reuse
+        self.gate_downsample = gate_downsample
+        self.gate_reference = None
+        self.gate_keypoints = None
+        self.gate_reused = 0
+        self.gate_stats = {'gated': 0, 'inferred': 0}
+        
+        # Optical-flow propagation between model frames
+        self.flow_interval = flow_interval
+        self.flow_decay = flow_decay
+        self.flow_decay_distance = flow_decay_distance
+        self.flow_gray = None
+        self.flow_keypoints = None
+        self.flow_since_model = None
+        self.flow_stats = {'model': 0, 'flow': 0}
+        
         self.keypoint_names = {
             0: 'nose', 1: 'left_eye', 2: 'right_eye', 3: 'left_ear', 4: 'right_ear',
             5: 'left_shoulder', 6: 'right_shoulder', 7: 'left_elbow', 8: 'right_elbow',
@@ -33,16 +93,10 @@ class PoseCalibrator:
             (11, 13), (13, 15), (12, 14), (14, 16)
         ]
         
-        self.joint_angles = {
-            'left_elbow': (5, 7, 9),
-            'right_elbow': (6, 8, 10),
-            'left_shoulder': (7, 5, 11),
-            'right_shoulder': (8, 6, 12),
-            'left_hip': (5, 11, 13),
-            'right_hip': (6, 12, 14),
-            'left_knee': (11, 13, 15),
-            'right_knee': (12, 14, 16),
-        }
+        self.joint_angles = dict(JOINT_ANGLES)
+        
+        # Angle features get_all_joint_angles computes (None = all), see set_features
+        self.features = None
         
         self.colors = {
             'keypoint': (0, 255, 0),
@@ -56,357 +110,359 @@ class PoseCalibrator:
     
     def detect_pose(self, frame):
         """Detect pose keypoints using YOLOv8"""
-        results = self.model(frame, verbose=False)
-        
-        if len(results[0].keypoints) > 0:
-            keypoints = results[0].keypoints.data[0].cpu().numpy()
-            return keypoints
-        
-        return None
-    
-    
-    def calculate_angle(self, pt1, pt2, pt3):
-        """Calculate angle between three points (in degrees)"""
-        pt1, pt2, pt3 = np.array(pt1), np.array(pt2), np.array(pt3)
+        return self.detect_pose_batch([frame])[0]
+    
+    
+    def detect_pose_batch(self, frames):
+        """Detect pose keypoints for several frames with a single model call"""
+        if self.flow_interval > 1:
+            return self._detect_with_flow(frames)
+        if self.motion_gate:
+            return self._detect_gated(frames)
+        
+        return self._infer(frames)
+    
+    
+    def model_identity(self, batch_size=1):
+        """
+        The model plus every detection option that changes the keypoints it
+        returns. ROI tracking, the motion gate and optical flow carry state
+        from one batch to the next, so with any of them on the keypoints
+        also depend on batch_size.
+        """
+        identity = (f"{backend_identity(self.backend)}"
+                    f"|tracking={self.tracking}:{self.track_margin}:{self.track_min_confidence}"
+                    f"|gate={self.motion_gate}:{self.gate_threshold}:{self.gate_max_reuse}:{self.gate_downsample}"
+                    f"|flow={self.flow_interval}:{self.flow_decay}:{self.flow_decay_distance}")
+        if self.tracking or self.motion_gate or self.flow_interval > 1:
+            identity += f"|batch={batch_size}"
+        return identity
+    
+    
+    def reset_tracking(self):
+        """Forget the tracked box, motion-gate and flow references, e.g. when a new video starts"""
+        self.track_box = None
+        self.tracking_stats = {'roi': 0, 'fallback': 0, 'full': 0}
+        
+        self.gate_reference = None
+        self.gate_keypoints = None
+        self.gate_reused = 0
+        self.gate_stats = {'gated': 0, 'inferred': 0}
+        
+        self.flow_gray = None
+        self.flow_keypoints = None
+        self.flow_since_model = None
+        self.flow_stats = {'model': 0, 'flow': 0}
+    
+    
+    def _infer(self, frames):
+        """Run the model on frames, through the ROI tracker when enabled"""
+        if not frames:
+            return []
+        if self.tracking:
+            return self._detect_tracked(frames)
+        
+        return self.backend.predict(frames)
+    
+    
+    def _detect_gated(self, frames):
+        """
+        Decide per frame whether the athlete moved since the last inferred
+        frame, infer only those that did, and give the rest the keypoints of
+        the inferred frame before them. With no athlete known yet the whole
+        frame is compared.
+        """
+        region = None
+        box = self._person_box(self.gate_keypoints)
+        if box is not None:
+            region = self._gate_region(box, frames[0].shape)
+        
+        infer_indices = []
+        for i, frame in enumerate(frames):
+            thumbnail = self._gate_thumbnail(frame)
+            
+            if self._gate_moved(thumbnail, region) or self.gate_reused >= self.gate_max_reuse:
+                infer_indices.append(i)
+                self.gate_reference = thumbnail
+                self.gate_reused = 0
+            else:
+                self.gate_reused += 1
         
-        v1 = pt1 - pt2
-        v2 = pt3 - pt2
+        inferred = dict(zip(infer_indices, self._infer([frames[i] for i in infer_indices])))
+        self.gate_stats['inferred'] += len(infer_indices)
+        self.gate_stats['gated'] += len(frames) - len(infer_indices)
         
-        v1_norm = np.linalg.norm(v1)
-        v2_norm = np.linalg.norm(v2)
+        keypoints = []
+        for i in range(len(frames)):
+            if i in inferred:
+                self.gate_keypoints = inferred[i]
+                keypoints.append(inferred[i])
+            else:
+                keypoints.append(None if self.gate_keypoints is None else self.gate_keypoints.copy())
+        
+        return keypoints
+    
+    
+    def _detect_with_flow(self, frames):
+        """
+        Run the model on the scheduled frames of the batch and propagate
+        keypoints with optical flow through the others, in frame order.
+        """
+        model_indices = []
+        since = self.flow_since_model
+        for i in range(len(frames)):
+            lost = i == 0 and self.flow_keypoints is None
+            if since is None or lost or since >= self.flow_interval - 1:
+                model_indices.append(i)
+                since = 0
+            else:
+                since += 1
+        self.flow_since_model = since
         
-        if v1_norm == 0 or v2_norm == 0:
-            return 0
+        model_results = dict(zip(model_indices, self._infer([frames[i] for i in model_indices])))
+        self.flow_stats['model'] += len(model_indices)
+        self.flow_stats['flow'] += len(frames) - len(model_indices)
         
-        cos_angle = np.dot(v1, v2) / (v1_norm * v2_norm)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        angle = np.degrees(np.arccos(cos_angle))
+        keypoints = []
+        for i, frame in enumerate(frames):
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            
+            if i in model_results:
+                frame_keypoints = model_results[i]
+            else:
+                frame_keypoints = self._propagate_keypoints(self.flow_gray, gray, self.flow_keypoints)
+            
+            self.flow_gray = gray
+            self.flow_keypoints = frame_keypoints
+            keypoints.append(frame_keypoints)
         
-        return int(round(angle))
+        return keypoints
     
     
-    def get_all_joint_angles(self, keypoints):
-        """Calculate angles for all major joints"""
-        angles = {}
-        
-        # Safety check
-        if keypoints is None or len(keypoints) < 17:
-            return {key: None for key in self.joint_angles.keys()}
-        
-        for joint_name, (idx1, idx2, idx3) in self.joint_angles.items():
-            try:
-                if (keypoints[idx1][2] > 0.5 and 
-                    keypoints[idx2][2] > 0.5 and 
-                    keypoints[idx3][2] > 0.5):
-                    
-                    pt1 = tuple(keypoints[idx1][:2])
-                    pt2 = tuple(keypoints[idx2][:2])
-                    pt3 = tuple(keypoints[idx3][:2])
-                    
-                    angle = self.calculate_angle(pt1, pt2, pt3)
-                    angles[joint_name] = angle
-                else:
-                    angles[joint_name] = None
-            except (IndexError, TypeError):
-                angles[joint_name] = None
-        
-        # Calculate torso angle (relative to vertical)
-        angles['torso_angle'] = self.calculate_torso_angle(keypoints)
-        
-        # Calculate shin angle (relative to vertical)
-        angles['shin_angle_left'] = self.calculate_shin_angle(keypoints, side='left')
-        angles['shin_angle_right'] = self.calculate_shin_angle(keypoints, side='right')
-        
-        # Calculate situp-specific angles (relative to horizontal)
-        angles['torso_inclination_horizontal'] = self.calculate_torso_inclination_horizontal(keypoints)
-        angles['hip_flexion_angle'] = self.calculate_hip_flexion_angle(keypoints)
-        
-        # Calculate sit-and-reach specific measurements
-        angles['reach_distance'] = self.calculate_reach_distance(keypoints)
-        angles['arm_length'] = self.calculate_arm_length(keypoints)
-        angles['sitnreach_hip_angle'] = self.calculate_sitnreach_hip_angle(keypoints)
-        angles['sitnreach_back_angle'] = self.calculate_sitnreach_back_angle(keypoints)
-        angles['sitnreach_knee_angle'] = self.calculate_sitnreach_knee_angle(keypoints)
-        angles['reach_symmetry'] = self.calculate_reach_symmetry(keypoints)
-        
-        # Calculate skipping-specific measurements
-        angles['skip_back_angle'] = self.calculate_skip_back_angle(keypoints)
-        angles['skip_knee_angle'] = self.calculate_skip_knee_angle(keypoints)
+    def _propagate_keypoints(self, prev_gray, gray, keypoints):
+        """Move keypoints from prev_gray to gray with pyramidal Lucas-Kanade flow"""
+        if keypoints is None or prev_gray is None or prev_gray.shape != gray.shape:
+            return None
         
-        # Calculate jumping jacks-specific measurements
-        angles['jj_arm_angle'] = self.calculate_jj_arm_angle(keypoints)
-        angles['jj_back_angle'] = self.calculate_jj_back_angle(keypoints)
+        points = keypoints[:, :2].astype(np.float32).reshape(-1, 1, 2)
+        moved, status, _ = cv2.calcOpticalFlowPyrLK(
+            prev_gray, gray, points, None, winSize=(21, 21), maxLevel=3,
+            criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 20, 0.03))
         
-        # Calculate vertical jump-specific measurements
-        angles['vjump_countermovement_angle'] = self.calculate_vjump_countermovement_angle(keypoints)
-        angles['vjump_arm_swing_angle'] = self.calculate_vjump_arm_swing_angle(keypoints)
-        angles['vjump_landing_knee_angle'] = self.calculate_vjump_landing_knee_angle(keypoints)
+        moved = moved.reshape(-1, 2)
+        found = status.reshape(-1) == 1
+        distance = np.linalg.norm(moved - keypoints[:, :2], axis=1)
         
-        # Calculate broad jump-specific measurements (same as vertical jump)
-        angles['bjump_countermovement_angle'] = self.calculate_vjump_countermovement_angle(keypoints)
-        angles['bjump_arm_swing_angle'] = self.calculate_vjump_arm_swing_angle(keypoints)
+        propagated = keypoints.copy()
+        propagated[found, :2] = moved[found]
+        propagated[:, 2] = keypoints[:, 2] * self.flow_decay * np.exp(-distance / self.flow_decay_distance)
+        propagated[~found, 2] = 0
         
-        return angles
+        return propagated
     
-    def calculate_torso_angle(self, keypoints):
-        """Calculate torso inclination angle relative to vertical axis"""
-        # Use shoulder and hip to define torso line
-        left_shoulder = keypoints[5]
-        right_shoulder = keypoints[6]
-        left_hip = keypoints[11]
-        right_hip = keypoints[12]
-        
-        # Check confidence
-        if (left_shoulder[2] > 0.5 and right_shoulder[2] > 0.5 and
-            left_hip[2] > 0.5 and right_hip[2] > 0.5):
-            
-            # Calculate midpoints
-            shoulder_mid = np.array([(left_shoulder[0] + right_shoulder[0]) / 2,
-                                    (left_shoulder[1] + right_shoulder[1]) / 2])
-            hip_mid = np.array([(left_hip[0] + right_hip[0]) / 2,
-                               (left_hip[1] + right_hip[1]) / 2])
-            
-            # Vector from hip to shoulder
-            torso_vector = shoulder_mid - hip_mid
-            
-            # Vertical vector (pointing up in image coordinates: negative y)
-            vertical_vector = np.array([0, -1])
+    
+    def _gate_thumbnail(self, frame):
+        """Small greyscale copy of the frame used for the motion gate"""
+        h, w = frame.shape[:2]
+        size = (max(1, w // self.gate_downsample), max(1, h // self.gate_downsample))
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        
+        return cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+    
+    
+    def _gate_region(self, box, frame_shape):
+        """Athlete box plus track_margin, in thumbnail coordinates"""
+        h, w = frame_shape[:2]
+        x1, y1, x2, y2 = box
+        margin = self.track_margin * max(x2 - x1, y2 - y1)
+        scale = self.gate_downsample
+        
+        return (max(0, int((x1 - margin) / scale)), max(0, int((y1 - margin) / scale)),
+                min(w // scale, int(math.ceil((x2 + margin) / scale))),
+                min(h // scale, int(math.ceil((y2 + margin) / scale))))
+    
+    
+    def _gate_moved(self, thumbnail, region):
+        """Whether the athlete region differs from the last inferred frame"""
+        if self.gate_reference is None:
+            return True
+        if self.gate_reference.shape != thumbnail.shape:
+            return True
+        
+        current, reference = thumbnail, self.gate_reference
+        if region is not None:
+            x1, y1, x2, y2 = region
+            if x2 <= x1 or y2 <= y1:
+                return True
+            current = current[y1:y2, x1:x2]
+            reference = reference[y1:y2, x1:x2]
+        
+        difference = cv2.absdiff(current, reference)
+        return float(np.mean(difference)) >= self.gate_threshold
+    
+    
+    def _detect_tracked(self, frames):
+        """
+        Run the batch on the tracked ROI, then re-run any frame whose crop
+        result is unusable on the full frame. The whole batch shares one crop,
+        since the athlete moves little within a batch.
+        """
+        keypoints = [None] * len(frames)
+        retry = list(range(len(frames)))
+        
+        if self.track_box is not None:
+            region = self._crop_region(frames[0].shape)
+            x1, y1, x2, y2 = region
+            crops = [frame[y1:y2, x1:x2] for frame in frames]
             
-            # Calculate angle
-            torso_norm = np.linalg.norm(torso_vector)
-            if torso_norm == 0:
-                return None
+            results = self.backend.predict(crops, imgsz=self._roi_imgsz(region, frames[0].shape))
             
-            cos_angle = np.dot(torso_vector, vertical_vector) / torso_norm
-            cos_angle = np.clip(cos_angle, -1.0, 1.0)
-            angle = np.degrees(np.arccos(cos_angle))
+            retry = []
+            for i, crop_keypoints in enumerate(results):
+                if crop_keypoints is not None:
+                    crop_keypoints = crop_keypoints.copy()
+                    crop_keypoints[:, 0] += x1
+                    crop_keypoints[:, 1] += y1
+                
+                if self._track_ok(crop_keypoints, region, frames[i].shape):
+                    keypoints[i] = crop_keypoints
+                else:
+                    retry.append(i)
             
-            return int(round(angle))
+            self.tracking_stats['roi'] += len(frames) - len(retry)
+            self.tracking_stats['fallback'] += len(retry)
         
-        return None
-    
-    def calculate_shin_angle(self, keypoints, side='left'):
-        """Calculate shin angle relative to vertical axis"""
-        if side == 'left':
-            knee = keypoints[13]
-            ankle = keypoints[15]
-        else:
-            knee = keypoints[14]
-            ankle = keypoints[16]
+        if retry:
+            full_results = self.backend.predict([frames[i] for i in retry])
+            for i, frame_keypoints in zip(retry, full_results):
+                keypoints[i] = frame_keypoints
+            self.tracking_stats['full'] += len(retry)
         
-        if knee[2] > 0.5 and ankle[2] > 0.5:
-            # Vector from ankle to knee
-            shin_vector = np.array([knee[0] - ankle[0], knee[1] - ankle[1]])
-            
-            # Vertical vector (pointing up)
-            vertical_vector = np.array([0, -1])
-            
-            # Calculate angle
-            shin_norm = np.linalg.norm(shin_vector)
-            if shin_norm == 0:
-                return None
-            
-            cos_angle = np.dot(shin_vector, vertical_vector) / shin_norm
-            cos_angle = np.clip(cos_angle, -1.0, 1.0)
-            angle = np.degrees(np.arccos(cos_angle))
-            
-            return int(round(angle))
+        # The next batch is cropped around the most recent frame
+        self.track_box = self._person_box(keypoints[-1])
         
-        return None
+        return keypoints
     
-    def calculate_torso_inclination_horizontal(self, keypoints):
-        """Calculate torso inclination angle relative to horizontal (for situps)."""
-        # Use shoulder and hip to define torso line
-        left_shoulder = keypoints[5]
-        right_shoulder = keypoints[6]
-        left_hip = keypoints[11]
-        right_hip = keypoints[12]
+    
+    def _person_box(self, keypoints, min_confidence=0.5):
+        """Bounding box (x1, y1, x2, y2) of the confident keypoints, or None"""
+        if keypoints is None:
+            return None
         
-        # Check confidence
-        if (left_shoulder[2] > 0.5 and right_shoulder[2] > 0.5 and
-            left_hip[2] > 0.5 and right_hip[2] > 0.5):
-            
-            # Calculate midpoints
-            shoulder_mid = np.array([(left_shoulder[0] + right_shoulder[0]) / 2,
-                                    (left_shoulder[1] + right_shoulder[1]) / 2])
-            hip_mid = np.array([(left_hip[0] + right_hip[0]) / 2,
-                               (left_hip[1] + right_hip[1]) / 2])
-            
-            # Calculate angle using atan2 (relative to horizontal)
-            dy = shoulder_mid[1] - hip_mid[1]  # Negative because y increases downward
-            dx = shoulder_mid[0] - hip_mid[0]
-            
-            # Calculate angle from horizontal
-            angle = np.degrees(np.arctan2(-dy, dx))
-            
-            # Return absolute angle (0-90 range typically)
-            return int(round(abs(angle)))
-        
-        return None
-    
-    def calculate_hip_flexion_angle(self, keypoints):
-        """Calculate hip flexion angle (shoulder-hip-knee) for situp crunch measurement."""
-        # Use the more confident side
-        left_shoulder = keypoints[5]
-        right_shoulder = keypoints[6]
-        left_hip = keypoints[11]
-        right_hip = keypoints[12]
-        left_knee = keypoints[13]
-        right_knee = keypoints[14]
-        
-        # Choose the side with better confidence
-        left_conf = min(left_shoulder[2], left_hip[2], left_knee[2])
-        right_conf = min(right_shoulder[2], right_hip[2], right_knee[2])
-        
-        if left_conf > right_conf and left_conf > 0.5:
-            shoulder = np.array(left_shoulder[:2])
-            hip = np.array(left_hip[:2])
-            knee = np.array(left_knee[:2])
-        elif right_conf > 0.5:
-            shoulder = np.array(right_shoulder[:2])
-            hip = np.array(right_hip[:2])
-            knee = np.array(right_knee[:2])
-        else:
+        visible = keypoints[keypoints[:, 2] > min_confidence]
+        if len(visible) < 3:
             return None
         
-        # Calculate angle at hip vertex
-        v1 = shoulder - hip
-        v2 = knee - hip
+        return (float(visible[:, 0].min()), float(visible[:, 1].min()),
+                float(visible[:, 0].max()), float(visible[:, 1].max()))
+    
+    
+    def _crop_region(self, frame_shape):
+        """Tracked box grown by track_margin and clipped to the frame (ints)"""
+        h, w = frame_shape[:2]
+        x1, y1, x2, y2 = self.track_box
+        margin = self.track_margin * max(x2 - x1, y2 - y1)
         
-        v1_norm = np.linalg.norm(v1)
-        v2_norm = np.linalg.norm(v2)
+        return (max(0, int(x1 - margin)), max(0, int(y1 - margin)),
+                min(w, int(math.ceil(x2 + margin))), min(h, int(math.ceil(y2 + margin))))
+    
+    
+    def _roi_imgsz(self, region, frame_shape):
+        """
+        Model input size for a crop: the crop is shrunk by the same factor a
+        full frame would be, so the athlete keeps the same resolution while
+        far fewer pixels go through the model.
+        """
+        full_imgsz = getattr(self.backend, 'imgsz', 640)
+        x1, y1, x2, y2 = region
+        scale = min(1.0, full_imgsz / max(frame_shape[:2]))
+        size = int(math.ceil(max(x2 - x1, y2 - y1) * scale / 32)) * 32
         
-        if v1_norm == 0 or v2_norm == 0:
-            return None
+        return int(np.clip(size, 160, full_imgsz))
+    
+    
+    def _track_ok(self, keypoints, region, frame_shape):
+        """Whether a crop result can be trusted: confident and not cut off by the crop"""
+        if keypoints is None or np.mean(keypoints[:, 2]) < self.track_min_confidence:
+            return False
         
-        cos_angle = np.dot(v1, v2) / (v1_norm * v2_norm)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        angle = np.degrees(np.arccos(cos_angle))
+        box = self._person_box(keypoints)
+        if box is None:
+            return False
         
-        return int(round(angle))
-    
-    def calculate_reach_distance(self, keypoints):
-        """Calculate forward reach distance (wrist_x - ankle_x)."""
-        # Use both wrists and take average
-        left_wrist = keypoints[9]
-        right_wrist = keypoints[10]
-        left_ankle = keypoints[15]
-        right_ankle = keypoints[16]
-        
-        wrist_conf = max(left_wrist[2], right_wrist[2])
-        ankle_conf = max(left_ankle[2], right_ankle[2])
-        
-        if wrist_conf > 0.5 and ankle_conf > 0.5:
-            # Average wrist and ankle positions
-            avg_wrist_x = (left_wrist[0] + right_wrist[0]) / 2
-            avg_ankle_x = (left_ankle[0] + right_ankle[0]) / 2
-            
-            reach_distance = avg_wrist_x - avg_ankle_x
-            return reach_distance
-        
-        return None
-    
-    def calculate_arm_length(self, keypoints):
-        """Calculate arm length (shoulder to wrist distance)."""
-        # Use the more confident side
-        left_shoulder = keypoints[5]
-        right_shoulder = keypoints[6]
-        left_wrist = keypoints[9]
-        right_wrist = keypoints[10]
-        
-        left_conf = min(left_shoulder[2], left_wrist[2])
-        right_conf = min(right_shoulder[2], right_wrist[2])
-        
-        if left_conf > right_conf and left_conf > 0.5:
-            shoulder = np.array(left_shoulder[:2])
-            wrist = np.array(left_wrist[:2])
-        elif right_conf > 0.5:
-            shoulder = np.array(right_shoulder[:2])
-            wrist = np.array(right_wrist[:2])
-        else:
-            return None
+        # A person touching a crop edge that is not also the frame edge is
+        # probably leaving the crop
+        h, w = frame_shape[:2]
+        x1, y1, x2, y2 = region
+        edge = 2
+        if (x1 > 0 and box[0] - x1 < edge) or (y1 > 0 and box[1] - y1 < edge):
+            return False
+        if (x2 < w and x2 - box[2] < edge) or (y2 < h and y2 - box[3] < edge):
+            return False
         
-        arm_length = np.linalg.norm(wrist - shoulder)
-        return arm_length
-    
-    def calculate_sitnreach_hip_angle(self, keypoints):
-        """Calculate hip angle for sit-and-reach (shoulder-hip-knee)."""
-        # Same as hip_flexion_angle but used for sit-and-reach context
-        return self.calculate_hip_flexion_angle(keypoints)
-    
-    def calculate_sitnreach_back_angle(self, keypoints):
-        """Calculate back alignment angle (shoulder-hip-knee for spine straightness)."""
-        # Use the more confident side
-        left_shoulder = keypoints[5]
-        right_shoulder = keypoints[6]
-        left_hip = keypoints[11]
-        right_hip = keypoints[12]
-        left_knee = keypoints[13]
-        right_knee = keypoints[14]
-        
-        left_conf = min(left_shoulder[2], left_hip[2], left_knee[2])
-        right_conf = min(right_shoulder[2], right_hip[2], right_knee[2])
-        
-        if left_conf > right_conf and left_conf > 0.5:
-            shoulder = np.array(left_shoulder[:2])
-            hip = np.array(left_hip[:2])
-            knee = np.array(left_knee[:2])
-        elif right_conf > 0.5:
-            shoulder = np.array(right_shoulder[:2])
-            hip = np.array(right_hip[:2])
-            knee = np.array(right_knee[:2])
-        else:
+        return True
+    
+    
+    @property
+    def body_scale(self):
+        """Median torso length in pixels, or None before any has been measured"""
+        if not self.torso_lengths:
             return None
+        return float(np.median(self.torso_lengths))
+    
+    
+    def update_body_scale(self, keypoints):
+        """Sample the torso length; the measurement is frozen once calibrated"""
+        if self.calibrated or keypoints is None:
+            return
         
-        # Calculate angle at hip
-        v1 = shoulder - hip
-        v2 = knee - hip
+        lengths = []
+        for shoulder_idx, hip_idx in [(5, 11), (6, 12)]:
+            shoulder = keypoints[shoulder_idx]
+            hip = keypoints[hip_idx]
+            if shoulder[2] > 0.5 and hip[2] > 0.5:
+                lengths.append(math.hypot(shoulder[0] - hip[0], shoulder[1] - hip[1]))
         
-        v1_norm = np.linalg.norm(v1)
-        v2_norm = np.linalg.norm(v2)
+        if lengths:
+            self.torso_lengths.append(float(np.mean(lengths)))
+    
+    
+    def update_calibration(self, keypoints, current_time=None):
+        """
+        Advance the calibration timer: it runs while a person is visible,
+        restarts when they leave, and completes after calibration_time
+        seconds. current_time is the frame time (None = wall clock).
+        """
+        if self.calibrated:
+            return
         
-        if v1_norm == 0 or v2_norm == 0:
-            return None
+        if keypoints is None:
+            self.calibration_start_time = None
+            self.calibration_elapsed = 0
+            return
         
-        cos_angle = np.dot(v1, v2) / (v1_norm * v2_norm)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        angle = np.degrees(np.arccos(cos_angle))
+        if current_time is None:
+            current_time = time.time()
+        if self.calibration_start_time is None:
+            self.calibration_start_time = current_time
         
-        return int(round(angle))
+        self.calibration_elapsed = current_time - self.calibration_start_time
+        if self.calibration_elapsed >= self.calibration_time:
+            self.calibrated = True
     
-    def calculate_sitnreach_knee_angle(self, keypoints):
-        """Calculate knee angle for validity check (hip-knee-ankle)."""
-        # Use the more confident side
-        left_hip = keypoints[11]
-        right_hip = keypoints[12]
-        left_knee = keypoints[13]
-        right_knee = keypoints[14]
-        left_ankle = keypoints[15]
-        right_ankle = keypoints[16]
-        
-        left_conf = min(left_hip[2], left_knee[2], left_ankle[2])
-        right_conf = min(right_hip[2], right_knee[2], right_ankle[2])
-        
-        if left_conf > right_conf and left_conf > 0.5:
-            hip = np.array(left_hip[:2])
-            knee = np.array(left_knee[:2])
-            ankle = np.array(left_ankle[:2])
-        elif right_conf > 0.5:
-            hip = np.array(right_hip[:2])
-            knee = np.array(right_knee[:2])
-            ankle = np.array(right_ankle[:2])
-        else:
-            return None
+    
+    def calculate_angle(self, pt1, pt2, pt3):
+        """Calculate angle between three points (in degrees)"""
+        pt1, pt2, pt3 = np.array(pt1), np.array(pt2), np.array(pt3)
         
-        # Calculate angle at knee
-        v1 = hip - knee
-        v2 = ankle - knee
+        v1 = pt1 - pt2
+        v2 = pt3 - pt2
         
         v1_norm = np.linalg.norm(v1)
         v2_norm = np.linalg.norm(v2)
         
         if v1_norm == 0 or v2_norm == 0:
-            return None
+            return 0
         
         cos_angle = np.dot(v1, v2) / (v1_norm * v2_norm)
         cos_angle = np.clip(cos_angle, -1.0, 1.0)
@@ -414,16 +470,43 @@ class PoseCalibrator:
         
         return int(round(angle))
     
-    def calculate_reach_symmetry(self, keypoints):
-        """Calculate reach symmetry error (left vs right wrist difference)."""
-        left_wrist = keypoints[9]
-        right_wrist = keypoints[10]
+    
+    def set_features(self, features):
+        """
+        Compute only these angle features (plus what they depend on) from now
+        on, e.g. the ones the active exercise's handler declares with
+        reads_features. None goes back to computing everything.
+        """
+        if features is not None:
+            unknown = [name for name in features if name not in FEATURES]
+            if unknown:
+                raise ValueError(f"Unknown angle features: {', '.join(unknown)}")
+            features = tuple(features)
+        self.features = features
+    
+    
+    def get_all_joint_angles(self, keypoints, features=None):
+        """Calculate angles for all major joints (or the given / active features)"""
+        # Safety check
+        if keypoints is None or len(keypoints) < 17:
+            return {key: None for key in self.joint_angles.keys()}
+        
+        if features is None:
+            features = self.features
         
-        if left_wrist[2] > 0.5 and right_wrist[2] > 0.5:
-            symmetry_error = abs(left_wrist[0] - right_wrist[0])
-            return symmetry_error
+        # One vectorized pass over the (17, 3) array (see angles.py)
+        values = compute_angles(np.asarray(keypoints)[None], features)
+        return {name: frame_value(name, column[0]) for name, column in values.items()}
+    
+    
+    def get_joint_angles_batch(self, keypoints, features=None):
+        """get_all_joint_angles for a (T, 17, 3) stack in one vectorized pass: one dict per frame"""
+        if features is None:
+            features = self.features
         
-        return None
+        values = compute_angles(np.asarray(keypoints), features)
+        return [{name: frame_value(name, column[i]) for name, column in values.items()}
+                for i in range(len(keypoints))]
     
     
     def draw_keypoints(self, frame, keypoints, min_confidence=0.5):
@@ -512,11 +595,20 @@ class PoseCalibrator:
         return frame
     
     
-    def draw_calibration_status(self, frame, keypoints):
-        """Draw calibration status"""
+    def calibration_state(self):
+        """(calibrated, elapsed seconds) snapshot, for drawing the banner later"""
+        return self.calibrated, self.calibration_elapsed
+    
+    
+    def draw_calibration_status(self, frame, keypoints, calibration=None):
+        """
+        Draw calibration status (the state itself is advanced by update_calibration).
+        calibration: a calibration_state() snapshot to draw instead of the current state
+        """
         h, w = frame.shape[:2]
+        calibrated, elapsed = calibration if calibration is not None else self.calibration_state()
         
-        if self.calibrated:
+        if calibrated:
             text = f"CALIBRATION SUCCESSFUL!"
             color = self.colors['calibration_text']
             font_scale = 0.8
@@ -524,25 +616,12 @@ class PoseCalibrator:
             text = "Please stand in front of the camera"
             color = self.colors['warning_text']
             font_scale = 0.8
-            self.calibration_start_time = None
-            self.calibration_elapsed = 0
         else:
-            if self.calibration_start_time is None:
-                self.calibration_start_time = time.time()
-            
-            self.calibration_elapsed = time.time() - self.calibration_start_time
-            remaining = max(0, self.calibration_time - self.calibration_elapsed)
-            progress = min(100, int((self.calibration_elapsed / self.calibration_time) * 100))
-            
-            if self.calibration_elapsed >= self.calibration_time:
-                text = f"CALIBRATION SUCCESSFUL!"
-                color = self.colors['calibration_text']
-                font_scale = 0.8
-                self.calibrated = True
-            else:
-                text = f"Calibrating... {progress}% ({int(remaining)}s remaining)"
-                color = (0, 255, 255)
-                font_scale = 0.7
+            remaining = max(0, self.calibration_time - elapsed)
+            progress = min(100, int((elapsed / self.calibration_time) * 100))
+            text = f"Calibrating... {progress}% ({int(remaining)}s remaining)"
+            color = (0, 255, 255)
+            font_scale = 0.7
         
         banner_height = 60
         overlay = frame.copy()
@@ -564,296 +643,75 @@ class PoseCalibrator:
     def process_frame(self, frame, show_angles_panel=True):
         """Process single frame: detect pose, draw skeleton"""
         keypoints = self.detect_pose(frame)
-        angles = {}
         
-        if keypoints is not None:
-            angles = self.get_all_joint_angles(keypoints)
-            
-            frame = self.draw_skeleton(frame, keypoints)
-            frame = self.draw_keypoints(frame, keypoints)
-            frame = self.draw_joint_angles(frame, keypoints, angles)
-        
-        frame = self.draw_calibration_status(frame, keypoints)
-        
-        return frame, keypoints, angles
+        return self.process_keypoints(frame, keypoints)
     
-    def calculate_skip_back_angle(self, keypoints):
-        """Calculate back angle for skipping posture (shoulder-hip-knee)."""
-        # Use the more confident side
-        left_shoulder = keypoints[5]
-        right_shoulder = keypoints[6]
-        left_hip = keypoints[11]
-        right_hip = keypoints[12]
-        left_knee = keypoints[13]
-        right_knee = keypoints[14]
-        
-        left_conf = min(left_shoulder[2], left_hip[2], left_knee[2])
-        right_conf = min(right_shoulder[2], right_hip[2], right_knee[2])
-        
-        if left_conf > right_conf and left_conf > 0.5:
-            shoulder = np.array(left_shoulder[:2])
-            hip = np.array(left_hip[:2])
-            knee = np.array(left_knee[:2])
-        elif right_conf > 0.5:
-            shoulder = np.array(right_shoulder[:2])
-            hip = np.array(right_hip[:2])
-            knee = np.array(right_knee[:2])
-        else:
-            return None
-        
-        # Calculate angle at hip
-        v1 = shoulder - hip
-        v2 = knee - hip
-        
-        v1_norm = np.linalg.norm(v1)
-        v2_norm = np.linalg.norm(v2)
-        
-        if v1_norm == 0 or v2_norm == 0:
-            return None
-        
-        cos_angle = np.dot(v1, v2) / (v1_norm * v2_norm)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        angle = np.degrees(np.arccos(cos_angle))
-        
-        return int(round(angle))
     
-    def calculate_skip_knee_angle(self, keypoints):
-        """Calculate knee angle for skipping (hip-knee-ankle)."""
-        # Use the more confident side
-        left_hip = keypoints[11]
-        right_hip = keypoints[12]
-        left_knee = keypoints[13]
-        right_knee = keypoints[14]
-        left_ankle = keypoints[15]
-        right_ankle = keypoints[16]
-        
-        left_conf = min(left_hip[2], left_knee[2], left_ankle[2])
-        right_conf = min(right_hip[2], right_knee[2], right_ankle[2])
-        
-        if left_conf > right_conf and left_conf > 0.5:
-            hip = np.array(left_hip[:2])
-            knee = np.array(left_knee[:2])
-            ankle = np.array(left_ankle[:2])
-        elif right_conf > 0.5:
-            hip = np.array(right_hip[:2])
-            knee = np.array(right_knee[:2])
-            ankle = np.array(right_ankle[:2])
-        else:
-            return None
-        
-        # Calculate angle at knee
-        v1 = hip - knee
-        v2 = ankle - knee
-        
-        v1_norm = np.linalg.norm(v1)
-        v2_norm = np.linalg.norm(v2)
-        
-        if v1_norm == 0 or v2_norm == 0:
-            return None
-        
-        cos_angle = np.dot(v1, v2) / (v1_norm * v2_norm)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        angle = np.degrees(np.arccos(cos_angle))
-        
-        return int(round(angle))
+    def update_frame_state(self, keypoints, current_time=None):
+        """Per-frame bookkeeping: body-scale sample and calibration timer"""
+        self.update_body_scale(keypoints)
+        self.update_calibration(keypoints, current_time)
     
-    def calculate_jj_arm_angle(self, keypoints):
-        """Calculate arm elevation angle for jumping jacks using shoulder joint angle (torso-shoulder-wrist)."""
-        # Use the more confident side
-        left_shoulder = keypoints[5]
-        right_shoulder = keypoints[6]
-        left_wrist = keypoints[9]
-        right_wrist = keypoints[10]
-        left_hip = keypoints[11]
-        right_hip = keypoints[12]
-        
-        left_conf = min(left_shoulder[2], left_wrist[2], left_hip[2])
-        right_conf = min(right_shoulder[2], right_wrist[2], right_hip[2])
-        
-        if left_conf > right_conf and left_conf > 0.5:
-            shoulder = np.array(left_shoulder[:2])
-            wrist = np.array(left_wrist[:2])
-            hip = np.array(left_hip[:2])
-        elif right_conf > 0.5:
-            shoulder = np.array(right_shoulder[:2])
-            wrist = np.array(right_wrist[:2])
-            hip = np.array(right_hip[:2])
-        else:
-            return None
-        
-        # Calculate shoulder joint angle: hip-shoulder-wrist
-        # This is the angle formed at the shoulder between torso and arm
-        v1 = hip - shoulder  # Vector from shoulder to hip (torso direction)
-        v2 = wrist - shoulder  # Vector from shoulder to wrist (arm direction)
-        
-        v1_norm = np.linalg.norm(v1)
-        v2_norm = np.linalg.norm(v2)
-        
-        if v1_norm == 0 or v2_norm == 0:
-            return None
-        
-        cos_angle = np.dot(v1, v2) / (v1_norm * v2_norm)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        angle = np.degrees(np.arccos(cos_angle))
-        
-        # Result:
-        # ~0° when arm is down along body (closed position)
-        # ~90° when arm is horizontal (transitioning)
-        # ~180° when arm is raised overhead (open position)
-        return int(round(angle))
     
-    def calculate_jj_back_angle(self, keypoints):
-        """Calculate back angle for jumping jacks posture (shoulder-hip-knee)."""
-        left_shoulder = keypoints[5]
-        right_shoulder = keypoints[6]
-        left_hip = keypoints[11]
-        right_hip = keypoints[12]
-        left_knee = keypoints[13]
-        right_knee = keypoints[14]
-        
-        left_conf = min(left_shoulder[2], left_hip[2], left_knee[2])
-        right_conf = min(right_shoulder[2], right_hip[2], right_knee[2])
-        
-        if left_conf > right_conf and left_conf > 0.5:
-            shoulder = np.array([left_shoulder[0], left_shoulder[1]])
-            hip = np.array([left_hip[0], left_hip[1]])
-            knee = np.array([left_knee[0], left_knee[1]])
-        elif right_conf > 0.5:
-            shoulder = np.array([right_shoulder[0], right_shoulder[1]])
-            hip = np.array([right_hip[0], right_hip[1]])
-            knee = np.array([right_knee[0], right_knee[1]])
-        else:
-            return None
-        
-        v1 = shoulder - hip
-        v2 = knee - hip
-        
-        v1_norm = np.linalg.norm(v1)
-        v2_norm = np.linalg.norm(v2)
-        
-        if v1_norm == 0 or v2_norm == 0:
-            return None
-        
-        cos_angle = np.dot(v1, v2) / (v1_norm * v2_norm)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        angle = np.degrees(np.arccos(cos_angle))
+    def analyze_keypoints(self, keypoints, current_time=None, features=None):
+        """
+        Headless frame processing: angles plus the per-frame state updates,
+        without drawing anything. Use when nobody will see the frame.
+        """
+        angles = {}
+        if keypoints is not None:
+            angles = self.get_all_joint_angles(keypoints, features)
         
-        return int(round(angle))
+        self.update_frame_state(keypoints, current_time)
+        return angles
     
-    def calculate_vjump_countermovement_angle(self, keypoints):
-        """Calculate knee angle during countermovement (hip-knee-ankle)."""
-        # Use the more confident side
-        left_hip = keypoints[11]
-        right_hip = keypoints[12]
-        left_knee = keypoints[13]
-        right_knee = keypoints[14]
-        left_ankle = keypoints[15]
-        right_ankle = keypoints[16]
-        
-        left_conf = min(left_hip[2], left_knee[2], left_ankle[2])
-        right_conf = min(right_hip[2], right_knee[2], right_ankle[2])
-        
-        if left_conf > right_conf and left_conf > 0.5:
-            hip = np.array([left_hip[0], left_hip[1]])
-            knee = np.array([left_knee[0], left_knee[1]])
-            ankle = np.array([left_ankle[0], left_ankle[1]])
-        elif right_conf > 0.5:
-            hip = np.array([right_hip[0], right_hip[1]])
-            knee = np.array([right_knee[0], right_knee[1]])
-            ankle = np.array([right_ankle[0], right_ankle[1]])
-        else:
-            return None
-        
-        v1 = hip - knee
-        v2 = ankle - knee
-        
-        v1_norm = np.linalg.norm(v1)
-        v2_norm = np.linalg.norm(v2)
-        
-        if v1_norm == 0 or v2_norm == 0:
-            return None
-        
-        cos_angle = np.dot(v1, v2) / (v1_norm * v2_norm)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        angle = np.degrees(np.arccos(cos_angle))
-        
-        return int(round(angle))
     
-    def calculate_vjump_arm_swing_angle(self, keypoints):
-        """Calculate arm swing angle (shoulder-elbow-wrist) for vertical jump."""
-        # Use the more confident side
-        left_shoulder = keypoints[5]
-        right_shoulder = keypoints[6]
-        left_elbow = keypoints[7]
-        right_elbow = keypoints[8]
-        left_wrist = keypoints[9]
-        right_wrist = keypoints[10]
-        
-        left_conf = min(left_shoulder[2], left_elbow[2], left_wrist[2])
-        right_conf = min(right_shoulder[2], right_elbow[2], right_wrist[2])
-        
-        if left_conf > right_conf and left_conf > 0.5:
-            shoulder = np.array([left_shoulder[0], left_shoulder[1]])
-            elbow = np.array([left_elbow[0], left_elbow[1]])
-            wrist = np.array([left_wrist[0], left_wrist[1]])
-        elif right_conf > 0.5:
-            shoulder = np.array([right_shoulder[0], right_shoulder[1]])
-            elbow = np.array([right_elbow[0], right_elbow[1]])
-            wrist = np.array([right_wrist[0], right_wrist[1]])
-        else:
-            return None
-        
-        v1 = shoulder - elbow
-        v2 = wrist - elbow
-        
-        v1_norm = np.linalg.norm(v1)
-        v2_norm = np.linalg.norm(v2)
-        
-        if v1_norm == 0 or v2_norm == 0:
+    def overlay_features(self):
+        """Features to compute when the frame is drawn: the overlay labels every joint angle"""
+        if self.features is None:
             return None
-        
-        cos_angle = np.dot(v1, v2) / (v1_norm * v2_norm)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        angle = np.degrees(np.arccos(cos_angle))
-        
-        return int(round(angle))
+        return self.features + tuple(JOINT_ANGLES)
     
-    def calculate_vjump_landing_knee_angle(self, keypoints):
-        """Calculate knee angle during landing (hip-knee-ankle)."""
-        # Use the more confident side
-        left_hip = keypoints[11]
-        right_hip = keypoints[12]
-        left_knee = keypoints[13]
-        right_knee = keypoints[14]
-        left_ankle = keypoints[15]
-        right_ankle = keypoints[16]
-        
-        left_conf = min(left_hip[2], left_knee[2], left_ankle[2])
-        right_conf = min(right_hip[2], right_knee[2], right_ankle[2])
-        
-        if left_conf > right_conf and left_conf > 0.5:
-            hip = np.array([left_hip[0], left_hip[1]])
-            knee = np.array([left_knee[0], left_knee[1]])
-            ankle = np.array([left_ankle[0], left_ankle[1]])
-        elif right_conf > 0.5:
-            hip = np.array([right_hip[0], right_hip[1]])
-            knee = np.array([right_knee[0], right_knee[1]])
-            ankle = np.array([right_ankle[0], right_ankle[1]])
-        else:
-            return None
-        
-        # Calculate angle at knee
-        v1 = hip - knee
-        v2 = ankle - knee
-        
-        v1_norm = np.linalg.norm(v1)
-        v2_norm = np.linalg.norm(v2)
-        
-        if v1_norm == 0 or v2_norm == 0:
-            return None
+    
+    def render(self, frame, keypoints, angles, calibration=None):
+        """Draw skeleton, keypoints, joint angles and calibration status onto the frame"""
+        if keypoints is not None:
+            frame = self.draw_skeleton(frame, keypoints)
+            frame = self.draw_keypoints(frame, keypoints)
+            frame = self.draw_joint_angles(frame, keypoints, angles)
         
-        cos_angle = np.dot(v1, v2) / (v1_norm * v2_norm)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        angle = np.degrees(np.arccos(cos_angle))
+        return self.draw_calibration_status(frame, keypoints, calibration)
+    
+    
+    def process_keypoints(self, frame, keypoints, current_time=None):
+        """Process a frame whose keypoints were already detected: angles, skeleton, status"""
+        angles = self.analyze_keypoints(keypoints, current_time, self.overlay_features())
+        frame = self.render(frame, keypoints, angles)
         
-        return int(round(angle))
+        return frame, keypoints, angles
+
+
+def clip_joint_angles(keypoints, features=None):
+    """
+    Angles for a whole clip at once, for offline re-scoring and experiments.
+    
+    keypoints: (T, 17, 3) array, or a list of per-frame (17, 3) arrays where
+    None marks a frame with no person.
+    Returns {name: (T,) float array} with the same names as
+    PoseCalibrator.get_all_joint_angles; angles are rounded to whole degrees
+    like the per-frame values, and NaN where confidence is below 0.5.
+    features limits the result to those names (see angles.FEATURES).
+    """
+    if not isinstance(keypoints, np.ndarray):
+        # Frames without a person become all-zero (zero-confidence) keypoints
+        stacked = np.zeros((len(keypoints), 17, 3), dtype=np.float32)
+        for i, frame_keypoints in enumerate(keypoints):
+            if frame_keypoints is not None:
+                stacked[i] = frame_keypoints
+        keypoints = stacked
+    
+    values = compute_angles(keypoints, features)
+    for name, column in values.items():
+        if name not in DISTANCE_FEATURES:
+            values[name] = np.round(column)
+    return values